@@ -3,13 +3,26 @@ Charting module for portfolio visualization.
 Provides modular charting functions that can be extended in the future.
 """
 
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.axes import Axes
+from matplotlib.colorbar import Colorbar
+from matplotlib.artist import Artist
+from matplotlib.offsetbox import AnchoredText
+from matplotlib.ticker import FuncFormatter
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+from kernels import drawdown, drawdowns_batch, lttb_indices, segment_compound
+
+# Number of (returns series, reduction) arrays kept per chart manager
+_CUM_CACHE_SIZE = 8
+
+# Shared y-axis formatter for currency values (stateless, safe to reuse across axes)
+_CURRENCY_FORMATTER = FuncFormatter(lambda x, p: f'${x:,.0f}')
 
 
 class PortfolioChartManager:
@@ -18,7 +31,8 @@ class PortfolioChartManager:
     Designed to be modular and extensible for future chart types.
     """
 
-    def __init__(self, dpi: int = 100):
+    def __init__(self, dpi: int = 100, rasterize_threshold: int = 5000,
+                 downsample_threshold: int = 4000, downsample_points: int = 2000):
         """
         Initialize the chart manager.
 
@@ -26,8 +40,18 @@ class PortfolioChartManager:
         -----------
         dpi : int
             Dots per inch for figure resolution
+        rasterize_threshold : int
+            Series longer than this have their data artists rasterized
+            (axes, labels and text stay vector)
+        downsample_threshold : int
+            Line series longer than this are downsampled (LTTB) before plotting
+        downsample_points : int
+            Number of points kept when a series is downsampled
         """
         self.dpi = dpi
+        self.rasterize_threshold = rasterize_threshold
+        self.downsample_threshold = downsample_threshold
+        self.downsample_points = downsample_points
         self.default_colors = {
             'portfolio': '#2E86AB',
             'benchmark': '#A23B72',
@@ -36,6 +60,72 @@ class PortfolioChartManager:
             'neutral': '#6C757D'
         }
 
+        # Figures are cached per chart type and cleared/replotted on refresh
+        self._figs: Dict[str, Figure] = {}
+        self._axes: Dict[str, Axes] = {}
+        self._colorbars: Dict[str, Colorbar] = {}
+        self._artists: Dict[str, Dict[str, Artist]] = {}
+
+        # Cumulative growth / drawdown arrays per returns series, shared across charts
+        self._cum_cache: Dict[Tuple[int, int, Callable], Tuple[pd.Series, np.ndarray]] = {}
+
+    def _get_figure(self, key: str, figsize: Tuple[int, int], clear: bool = True) -> Tuple[Figure, Axes]:
+        """
+        Return the cached figure and axes for a chart type, resized to figsize and
+        cleared for replotting unless clear is False. A new figure is created on
+        first use only.
+        """
+        fig = self._figs.get(key)
+        if fig is None:
+            fig = Figure(figsize=figsize, dpi=self.dpi)
+            self._figs[key] = fig
+            self._axes[key] = fig.add_subplot(111)
+            return fig, self._axes[key]
+
+        fig.set_size_inches(figsize, forward=True)
+        if clear:
+            self._artists.pop(key, None)
+            colorbar = self._colorbars.pop(key, None)
+            if colorbar is not None:
+                colorbar.remove()
+            self._axes[key].cla()
+        return fig, self._axes[key]
+
+    def _series_array(self, returns_data: pd.Series,
+                      reduction: Callable[[pd.Series], np.ndarray]) -> np.ndarray:
+        """
+        Return reduction(returns_data), e.g. _cumulative_growth or _drawdown.
+        Results are memoized per series object so switching between chart
+        types for the same analysis does not repeat the reductions.
+        """
+        key = (id(returns_data), len(returns_data), reduction)
+        hit = self._cum_cache.get(key)
+        if hit is not None and hit[0] is returns_data:
+            return hit[1]
+
+        result = reduction(returns_data)
+
+        # Keep a reference to the series so its id cannot be reused while cached
+        if len(self._cum_cache) >= _CUM_CACHE_SIZE:
+            del self._cum_cache[next(iter(self._cum_cache))]
+        self._cum_cache[key] = (returns_data, result)
+        return result
+
+    def _plot_xy(self, index: pd.Index, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Prepare (dates, values) arrays for a line plot.
+
+        Long series are reduced to a visually faithful subset using
+        Largest-Triangle-Three-Buckets, and values are down-cast to float32
+        since the extra float64 precision never reaches the rendered pixels.
+        """
+        dates = _plot_dates(index)
+        if len(values) > self.downsample_threshold:
+            x = dates.view(np.int64).astype(np.float64)
+            idx = lttb_indices(x, values, self.downsample_points)
+            dates, values = dates[idx], values[idx]
+        return dates, values.astype(np.float32, copy=False)
+
     def create_equity_curve(self,
                             portfolio_data: pd.Series,
                             benchmark_data: pd.Series,
@@ -65,24 +155,56 @@ class PortfolioChartManager:
         --------
         Figure : matplotlib Figure object
         """
-        fig = Figure(figsize=figsize, dpi=self.dpi)
-        ax = fig.add_subplot(111)
+        # Reuse the previous plot's artists when the figure is already built
+        artists = self._artists.get('equity_curve')
+        fig, ax = self._get_figure('equity_curve', figsize, clear=artists is None)
+
+        # Calculate cumulative values starting at initial_value (log-space for stability)
+        portfolio_equity = initial_value * self._series_array(portfolio_data, _cumulative_growth)
+        benchmark_equity = initial_value * self._series_array(benchmark_data, _cumulative_growth)
+        portfolio_xy = self._plot_xy(portfolio_data.index, portfolio_equity)
+        benchmark_xy = self._plot_xy(benchmark_data.index, benchmark_equity)
+        rasterized = len(portfolio_data) > self.rasterize_threshold
+
+        # Performance stats
+        final_portfolio = portfolio_equity[-1]
+        final_benchmark = benchmark_equity[-1]
+        portfolio_return = (final_portfolio / initial_value - 1) * 100
+        benchmark_return = (final_benchmark / initial_value - 1) * 100
+        outperformance = portfolio_return - benchmark_return
+
+        stats_text = (f'Total Return:\n'
+                      f'{portfolio_name}: {portfolio_return:+.2f}%\n'
+                      f'{benchmark_name}: {benchmark_return:+.2f}%\n'
+                      f'Outperformance: {outperformance:+.2f}%')
 
-        # Calculate cumulative values starting at initial_value
-        portfolio_equity = initial_value * (1 + portfolio_data).cumprod()
-        benchmark_equity = initial_value * (1 + benchmark_data).cumprod()
+        if artists is not None:
+            # Refresh: update the existing lines and stats box in place
+            for artist_key, xy, label in (('portfolio', portfolio_xy, portfolio_name),
+                                          ('benchmark', benchmark_xy, benchmark_name)):
+                line = artists[artist_key]
+                line.set_data(*xy)
+                line.set_label(label)
+                line.set_rasterized(rasterized)
+            artists['stats_text'].txt.set_text(stats_text)
+            ax.relim()
+            ax.autoscale_view()
+            ax.legend(loc='best', fontsize=10, framealpha=0.9)
+            return fig
 
         # Plot equity curves
-        ax.plot(portfolio_equity.index, portfolio_equity.values,
-                label=portfolio_name,
-                color=self.default_colors['portfolio'],
-                linewidth=2)
-
-        ax.plot(benchmark_equity.index, benchmark_equity.values,
-                label=benchmark_name,
-                color=self.default_colors['benchmark'],
-                linewidth=2,
-                linestyle='--')
+        line_portfolio, = ax.plot(*portfolio_xy,
+                                  label=portfolio_name,
+                                  color=self.default_colors['portfolio'],
+                                  linewidth=2,
+                                  rasterized=rasterized)
+
+        line_benchmark, = ax.plot(*benchmark_xy,
+                                  label=benchmark_name,
+                                  color=self.default_colors['benchmark'],
+                                  linewidth=2,
+                                  linestyle='--',
+                                  rasterized=rasterized)
 
         # Formatting
         ax.set_title('Portfolio Performance vs Benchmark',
@@ -93,25 +215,20 @@ class PortfolioChartManager:
         ax.grid(True, alpha=0.3, linestyle='--')
 
         # Format y-axis as currency
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+        ax.yaxis.set_major_formatter(_CURRENCY_FORMATTER)
 
         # Add performance stats box
-        final_portfolio = portfolio_equity.iloc[-1]
-        final_benchmark = benchmark_equity.iloc[-1]
-        portfolio_return = (final_portfolio / initial_value - 1) * 100
-        benchmark_return = (final_benchmark / initial_value - 1) * 100
-        outperformance = portfolio_return - benchmark_return
-
-        stats_text = (f'Total Return:\n'
-                      f'{portfolio_name}: {portfolio_return:+.2f}%\n'
-                      f'{benchmark_name}: {benchmark_return:+.2f}%\n'
-                      f'Outperformance: {outperformance:+.2f}%')
-
-        ax.text(0.02, 0.98, stats_text,
-                transform=ax.transAxes,
-                fontsize=9,
-                verticalalignment='top',
-                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        stats_box = AnchoredText(stats_text, loc='upper left', prop=dict(size=9), frameon=True)
+        stats_box.patch.set_boxstyle('round')
+        stats_box.patch.set_facecolor('wheat')
+        stats_box.patch.set_alpha(0.8)
+        ax.add_artist(stats_box)
+
+        self._artists['equity_curve'] = {
+            'portfolio': line_portfolio,
+            'benchmark': line_benchmark,
+            'stats_text': stats_box
+        }
 
         fig.tight_layout()
         return fig
@@ -142,39 +259,38 @@ class PortfolioChartManager:
         --------
         Figure : matplotlib Figure object
         """
-        fig = Figure(figsize=figsize, dpi=self.dpi)
-        ax = fig.add_subplot(111)
+        fig, ax = self._get_figure('drawdown', figsize)
 
-        # Calculate portfolio drawdown
-        portfolio_cum = (1 + portfolio_data).cumprod()
-        portfolio_running_max = portfolio_cum.cummax()
-        portfolio_drawdown = (portfolio_cum - portfolio_running_max) / portfolio_running_max
+        # Calculate portfolio drawdown (percent)
+        portfolio_drawdown = self._series_array(portfolio_data, _drawdown) * 100.0
+        portfolio_dates, portfolio_drawdown = self._plot_xy(portfolio_data.index, portfolio_drawdown)
+        rasterized = len(portfolio_data) > self.rasterize_threshold
 
         # Plot portfolio drawdown
-        ax.fill_between(portfolio_drawdown.index,
-                        portfolio_drawdown.values * 100,
+        ax.fill_between(portfolio_dates,
+                        portfolio_drawdown,
                         0,
                         color=self.default_colors['negative'],
                         alpha=0.3,
-                        label=portfolio_name)
+                        label=portfolio_name,
+                        rasterized=rasterized)
 
-        ax.plot(portfolio_drawdown.index,
-                portfolio_drawdown.values * 100,
+        ax.plot(portfolio_dates,
+                portfolio_drawdown,
                 color=self.default_colors['negative'],
-                linewidth=1.5)
+                linewidth=1.5,
+                rasterized=rasterized)
 
         # If benchmark provided, calculate and plot its drawdown
         if benchmark_data is not None:
-            benchmark_cum = (1 + benchmark_data).cumprod()
-            benchmark_running_max = benchmark_cum.cummax()
-            benchmark_drawdown = (benchmark_cum - benchmark_running_max) / benchmark_running_max
+            benchmark_drawdown = self._series_array(benchmark_data, _drawdown) * 100.0
 
-            ax.plot(benchmark_drawdown.index,
-                    benchmark_drawdown.values * 100,
+            ax.plot(*self._plot_xy(benchmark_data.index, benchmark_drawdown),
                     color=self.default_colors['benchmark'],
                     linewidth=1.5,
                     linestyle='--',
-                    label=benchmark_name)
+                    label=benchmark_name,
+                    rasterized=rasterized)
 
         # Formatting
         ax.set_title('Drawdown Analysis', fontsize=14, fontweight='bold', pad=20)
@@ -207,43 +323,45 @@ class PortfolioChartManager:
         --------
         Figure : matplotlib Figure object
         """
-        fig = Figure(figsize=figsize, dpi=self.dpi)
-        ax = fig.add_subplot(111)
-
-        # Resample to monthly returns
-        monthly_returns = (1 + returns_data).resample('ME').prod() - 1
-
-        # Pivot into year x month format
-        monthly_returns_df = pd.DataFrame({
-            'Year': monthly_returns.index.year,
-            'Month': monthly_returns.index.month,
-            'Return': monthly_returns.values * 100
-        })
-
-        pivot_table = monthly_returns_df.pivot(index='Year', columns='Month', values='Return')
+        fig, ax = self._get_figure('monthly_returns', figsize)
+
+        # Compound daily returns into calendar months with one segmented reduction
+        dates = returns_data.index
+        month_ids = dates.year.to_numpy() * 12 + (dates.month.to_numpy() - 1)
+        starts = np.r_[0, np.flatnonzero(np.diff(month_ids)) + 1]
+        boundaries = np.r_[starts, len(month_ids)].astype(np.int64)
+        returns = returns_data.to_numpy(dtype=np.float64)
+        monthly_returns = segment_compound(returns, boundaries) * 100
+
+        # Scatter into a year x month grid (NaN for months without data)
+        segment_ids = month_ids[starts]
+        first_year = segment_ids[0] // 12
+        years = np.arange(first_year, segment_ids[-1] // 12 + 1)
+        monthly_grid = np.full((len(years), 12), np.nan, dtype=np.float32)
+        monthly_grid[segment_ids // 12 - first_year, segment_ids % 12] = monthly_returns
 
         # Create heatmap
-        im = ax.imshow(pivot_table.values, cmap='RdYlGn', aspect='auto', vmin=-10, vmax=10)
+        im = ax.imshow(monthly_grid, cmap='RdYlGn', aspect='auto', vmin=-10, vmax=10)
 
         # Set ticks and labels
-        ax.set_xticks(np.arange(len(pivot_table.columns)))
-        ax.set_yticks(np.arange(len(pivot_table.index)))
+        ax.set_xticks(np.arange(12))
+        ax.set_yticks(np.arange(len(years)))
         ax.set_xticklabels(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
-        ax.set_yticklabels(pivot_table.index.astype(int))
+        ax.set_yticklabels(years)
 
         # Add colorbar
         cbar = fig.colorbar(im, ax=ax)
+        self._colorbars['monthly_returns'] = cbar
         cbar.set_label('Return (%)', rotation=270, labelpad=15)
 
-        # Add text annotations
-        for i in range(len(pivot_table.index)):
-            for j in range(len(pivot_table.columns)):
-                value = pivot_table.values[i, j]
-                if not np.isnan(value):
-                    text_color = 'white' if abs(value) > 5 else 'black'
-                    ax.text(j, i, f'{value:.1f}%',
-                            ha="center", va="center", color=text_color, fontsize=8)
+        # Add text annotations for cells with data only
+        rows, cols = np.nonzero(~np.isnan(monthly_grid))
+        values = monthly_grid[rows, cols]
+        text_colors = np.where(np.abs(values) > 5, 'white', 'black')
+        for i, j, value, text_color in zip(rows, cols, values, text_colors):
+            ax.text(j, i, f'{value:.1f}%',
+                    ha="center", va="center", color=text_color, fontsize=8)
 
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
         ax.set_xlabel('Month', fontsize=11)
@@ -272,22 +390,18 @@ class PortfolioChartManager:
         --------
         Figure : matplotlib Figure object
         """
-        fig = Figure(figsize=figsize, dpi=self.dpi)
-        ax = fig.add_subplot(111)
+        fig, ax = self._get_figure('returns_distribution', figsize)
 
         returns_pct = returns_data * 100
 
-        # Create histogram
-        n, bins, patches = ax.hist(returns_pct, bins=50, alpha=0.7,
-                                   color=self.default_colors['portfolio'],
-                                   edgecolor='black', linewidth=0.5)
-
-        # Color bars based on positive/negative
-        for i, patch in enumerate(patches):
-            if bins[i] < 0:
-                patch.set_facecolor(self.default_colors['negative'])
-            else:
-                patch.set_facecolor(self.default_colors['positive'])
+        # Create histogram, coloring bars based on positive/negative bin edges
+        counts, bins = np.histogram(returns_pct.to_numpy(), bins=50)
+        colors = np.where(bins[:-1] < 0,
+                          self.default_colors['negative'],
+                          self.default_colors['positive'])
+        ax.bar(bins[:-1], counts, width=np.diff(bins), align='edge',
+               color=colors, alpha=0.7, edgecolor='black', linewidth=0.5,
+               rasterized=len(returns_data) > self.rasterize_threshold)
 
         # Add vertical line at mean
         mean_return = returns_pct.mean()
@@ -308,10 +422,31 @@ class PortfolioChartManager:
         fig.tight_layout()
         return fig
 
+    def drawdowns_batch(self, returns_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate drawdowns for every column of a returns DataFrame in one pass.
+
+        Parameters:
+        -----------
+        returns_data : pd.DataFrame
+            Daily returns (indexed by date), one column per ticker
+
+        Returns:
+        --------
+        pd.DataFrame : Drawdowns in percent, same shape/labels as returns_data
+        """
+        returns = np.ascontiguousarray(returns_data.to_numpy(dtype=np.float64))
+        return pd.DataFrame(drawdowns_batch(returns) * 100,
+                            index=returns_data.index, columns=returns_data.columns)
+
     def embed_figure_in_tk(self, figure: Figure, parent_frame) -> FigureCanvasTkAgg:
         """
         Embed a matplotlib figure in a tkinter frame.
 
+        Figures that were already embedded in the same frame (cached chart
+        figures) reuse their existing canvas widget. Drawing is always deferred
+        to the Tk event loop so the figure is painted once, at its final size.
+
         Parameters:
         -----------
         figure : Figure
@@ -323,12 +458,65 @@ class PortfolioChartManager:
         --------
         FigureCanvasTkAgg : Canvas widget containing the figure
         """
+        canvas = figure.canvas
+        if (isinstance(canvas, FigureCanvasTkAgg)
+                and canvas.get_tk_widget().master is parent_frame
+                and canvas.get_tk_widget().winfo_exists()):
+            canvas.get_tk_widget().pack(fill='both', expand=True)
+            canvas.draw_idle()
+            return canvas
+
+        # Pack before drawing so the single deferred paint uses the final widget size
         canvas = FigureCanvasTkAgg(figure, master=parent_frame)
-        canvas.draw()
         canvas.get_tk_widget().pack(fill='both', expand=True)
+        canvas.draw_idle()
         return canvas
 
 
+def _plot_dates(index: pd.Index) -> np.ndarray:
+    """
+    Convert a date index to a tz-naive datetime64 ndarray.
+
+    Passing raw datetime64 arrays lets matplotlib use its native date path
+    instead of the slower pandas converter (especially for tz-aware indexes).
+    """
+    if getattr(index, 'tz', None) is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy()
+
+
+def _cumulative_growth(returns_data: pd.Series) -> np.ndarray:
+    """
+    Compound a returns series into a growth-of-$1 array.
+
+    Computed as exp(cumsum(log1p(r))) on the underlying ndarray, which is
+    numerically stable over long series and avoids pandas' cumprod overhead.
+    """
+    values = returns_data.to_numpy(dtype=np.float64, copy=False)
+    return np.exp(np.cumsum(np.log1p(values)))
+
+
+def _drawdown(returns_data: pd.Series) -> np.ndarray:
+    """Drawdown from the running peak (as decimals), in one fused kernels.drawdown pass."""
+    return drawdown(returns_data.to_numpy(dtype=np.float64))
+
+
+@lru_cache(maxsize=32)
+def _weights_vector(holdings_items: Tuple[Tuple[str, float], ...],
+                    columns: Tuple[str, ...]) -> Tuple[List[str], np.ndarray]:
+    """
+    Select the held tickers present in columns and build their weight vector.
+    Cached per (holdings, columns) so repeated backtests of the same portfolio
+    skip the per-ticker Python work.
+    """
+    available = set(columns)
+    tickers = [ticker for ticker, _ in holdings_items if ticker in available]
+    weights = np.fromiter((weight for ticker, weight in holdings_items if ticker in available),
+                          dtype=np.float64, count=len(tickers))
+    weights.flags.writeable = False
+    return tickers, weights
+
+
 def calculate_portfolio_daily_returns(holdings: Dict[str, float],
                                       returns_series: Dict[str, pd.Series]) -> pd.Series:
     """
@@ -348,10 +536,8 @@ def calculate_portfolio_daily_returns(holdings: Dict[str, float],
     # Align all returns series
     aligned_returns = pd.DataFrame(returns_series).dropna()
 
-    # Calculate weighted returns
-    portfolio_returns = pd.Series(0.0, index=aligned_returns.index)
-    for ticker, weight in holdings.items():
-        if ticker in aligned_returns.columns:
-            portfolio_returns += aligned_returns[ticker] * weight
+    # Calculate weighted returns as a single matrix-vector product
+    tickers, weights = _weights_vector(tuple(holdings.items()), tuple(aligned_returns.columns))
+    returns_matrix = aligned_returns[tickers].to_numpy(dtype=np.float64, copy=False)
 
-    return portfolio_returns
\ No newline at end of file
+    return pd.Series(returns_matrix @ weights, index=aligned_returns.index)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 
 
@@ -22,18 +23,27 @@ def generate_tree(
         ignore_extensions_in_data = ['.csv']
 
     start_path = Path(start_path)
-    print(f"📁 {start_path.resolve().name}")
+    out = [f"📁 {start_path.resolve().name}"]
 
-    # Walk the tree
-    _print_tree(start_path, "", ignore_dirs, ignore_extensions_in_data)
+    # Walk the tree, collecting lines so the output is written in one call
+    _print_tree(start_path, "", set(ignore_dirs), set(ignore_extensions_in_data), out,
+                in_data='data' in start_path.parts)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def _print_tree(current_path: Path, prefix: str, ignore_dirs: list, ignore_extensions_in_data: list):
+def _list_dir(current_path, prefix: str, ignore_dirs: set, ignore_extensions_in_data: set,
+              in_data: bool = False) -> list:
+    """
+    List a directory's visible entries as (line, subdir, child_prefix, child_in_data) frames.
+    subdir is the DirEntry to descend into, or None for files. in_data is True
+    when current_path is a 'data' folder or one of its subfolders.
+    """
     # Get all items in directory, sorted for consistent output
     try:
-        items = sorted(list(current_path.iterdir()))
+        with os.scandir(current_path) as it:
+            items = sorted(it, key=lambda entry: entry.name)
     except PermissionError:
-        return
+        return []
 
     # Filter out ignored directories immediately
     items = [item for item in items if item.name not in ignore_dirs]
@@ -41,25 +51,40 @@ def _print_tree(current_path: Path, prefix: str, ignore_dirs: list, ignore_exten
     # Filter out specific files (CSVs in data folder)
     filtered_items = []
     for item in items:
-        # Check if we are currently inside a 'data' folder (or subfolder of data)
-        is_in_data = 'data' in item.parts
-
-        if is_in_data and item.is_file() and item.suffix.lower() in ignore_extensions_in_data:
+        if (in_data and item.is_file(follow_symlinks=False)
+                and os.path.splitext(item.name)[1].lower() in ignore_extensions_in_data):
             continue
         filtered_items.append(item)
 
     count = len(filtered_items)
+    frames = []
 
     for index, item in enumerate(filtered_items):
         connector = "└── " if index == count - 1 else "├── "
 
-        if item.is_dir():
-            print(f"{prefix}{connector}📂 {item.name}")
+        if item.is_dir(follow_symlinks=False):
             # Prepare prefix for children
             new_prefix = prefix + ("    " if index == count - 1 else "│   ")
-            _print_tree(item, new_prefix, ignore_dirs, ignore_extensions_in_data)
+            frames.append((f"{prefix}{connector}📂 {item.name}", item, new_prefix,
+                           in_data or item.name == 'data'))
         else:
-            print(f"{prefix}{connector}📄 {item.name}")
+            frames.append((f"{prefix}{connector}📄 {item.name}", None, None, in_data))
+
+    return frames
+
+
+def _print_tree(start_path: Path, prefix: str, ignore_dirs: set, ignore_extensions_in_data: set, out: list,
+                in_data: bool = False):
+    # Depth-first walk with an explicit stack; frames are pushed in reverse so
+    # they pop in sorted order and each directory's children print beneath it
+    stack = _list_dir(start_path, prefix, ignore_dirs, ignore_extensions_in_data, in_data)[::-1]
+
+    while stack:
+        line, subdir, child_prefix, child_in_data = stack.pop()
+        out.append(line)
+        if subdir is not None:
+            stack.extend(_list_dir(subdir, child_prefix, ignore_dirs, ignore_extensions_in_data,
+                                   child_in_data)[::-1])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,291 @@
+"""
+Numerical kernels shared by the analysis and charting modules.
+Kernels are JIT-compiled with numba when it is installed and fall back to
+equivalent vectorized NumPy implementations otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def drawdown(returns: np.ndarray) -> np.ndarray:
+        """
+        Compute the drawdown series of a returns array in a single pass.
+
+        Parameters:
+        -----------
+        returns : np.ndarray
+            1-D array of periodic returns (as decimals)
+
+        Returns:
+        --------
+        np.ndarray : Drawdown from the running peak at each period (<= 0)
+        """
+        n = returns.size
+        out = np.empty(n)
+        cum = 1.0
+        peak = 0.0
+        for i in range(n):
+            cum *= 1.0 + returns[i]
+            if cum > peak:
+                peak = cum
+            out[i] = (cum - peak) / peak
+        return out
+else:
+    def drawdown(returns: np.ndarray) -> np.ndarray:
+        """Compute the drawdown series of a returns array (NumPy fallback)."""
+        cum = np.exp(np.cumsum(np.log1p(returns)))
+        running_max = np.maximum.accumulate(cum)
+        return (cum - running_max) / running_max
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def return_stats(returns: np.ndarray):
+        """
+        Compute drawdown and distribution statistics of a returns array in a single pass.
+
+        Central moments are accumulated with the numerically stable online update
+        (Terriberry's extension of Welford's algorithm).
+
+        Parameters:
+        -----------
+        returns : np.ndarray
+            1-D array of periodic returns (as decimals)
+
+        Returns:
+        --------
+        tuple : (max drawdown, drawdown at the last period, fraction of positive periods,
+                 mean, 2nd, 3rd and 4th central moments)
+        """
+        n = returns.size
+        cum = 1.0
+        peak = 0.0
+        max_dd = 0.0
+        dd = 0.0
+        ups = 0
+        mean = 0.0
+        s2 = 0.0
+        s3 = 0.0
+        s4 = 0.0
+        for i in range(n):
+            r = returns[i]
+            cum *= 1.0 + r
+            if cum > peak:
+                peak = cum
+            dd = (cum - peak) / peak
+            if dd < max_dd:
+                max_dd = dd
+            if r > 0.0:
+                ups += 1
+
+            k = i + 1
+            delta = r - mean
+            delta_k = delta / k
+            delta_k2 = delta_k * delta_k
+            term = delta * delta_k * i
+            mean += delta_k
+            s4 += term * delta_k2 * (k * k - 3 * k + 3) + 6.0 * delta_k2 * s2 - 4.0 * delta_k * s3
+            s3 += term * delta_k * (k - 2) - 3.0 * delta_k * s2
+            s2 += term
+        return max_dd, dd, ups / n, mean, s2 / n, s3 / n, s4 / n
+else:
+    def return_stats(returns: np.ndarray):
+        """Compute drawdown and distribution statistics of a returns array (NumPy fallback)."""
+        dd = drawdown(returns)
+        mean = returns.mean()
+        dev = returns - mean
+        dev2 = dev * dev
+        return (dd.min(), dd[-1], np.count_nonzero(returns > 0) / returns.size,
+                mean, dev2.mean(), (dev2 * dev).mean(), (dev2 * dev2).mean())
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def drawdowns_batch(returns: np.ndarray) -> np.ndarray:
+        """
+        Compute drawdown series for many assets at once, one column per asset.
+
+        Parameters:
+        -----------
+        returns : np.ndarray
+            2-D (T, N) array of periodic returns (as decimals)
+
+        Returns:
+        --------
+        np.ndarray : (T, N) drawdowns from each column's running peak (<= 0)
+        """
+        n_periods, n_assets = returns.shape
+        out = np.empty_like(returns)
+        for j in prange(n_assets):
+            cum = 1.0
+            peak = 0.0
+            for i in range(n_periods):
+                cum *= 1.0 + returns[i, j]
+                if cum > peak:
+                    peak = cum
+                out[i, j] = (cum - peak) / peak
+        return out
+else:
+    def drawdowns_batch(returns: np.ndarray) -> np.ndarray:
+        """Compute drawdown series for many assets at once (NumPy fallback)."""
+        cum = np.exp(np.cumsum(np.log1p(returns), axis=0))
+        running_max = np.maximum.accumulate(cum, axis=0)
+        return (cum - running_max) / running_max
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def portfolio_variance(weights: np.ndarray, volatilities: np.ndarray, corr: np.ndarray) -> float:
+        """
+        Compute portfolio variance Σᵢ Σⱼ wᵢ wⱼ σᵢ σⱼ ρᵢⱼ from the upper triangle of corr.
+
+        Parameters:
+        -----------
+        weights : np.ndarray
+            1-D array of portfolio weights
+        volatilities : np.ndarray
+            1-D array of per-asset volatilities, aligned with weights
+        corr : np.ndarray
+            2-D symmetric correlation matrix, aligned with weights
+
+        Returns:
+        --------
+        float : Portfolio variance
+        """
+        n = weights.size
+        acc = 0.0
+        for i in prange(n):
+            wi = weights[i] * volatilities[i]
+            off = 0.0
+            for j in range(i + 1, n):
+                off += weights[j] * volatilities[j] * corr[i, j]
+            acc += wi * wi * corr[i, i] + 2.0 * wi * off
+        return acc
+else:
+    def portfolio_variance(weights: np.ndarray, volatilities: np.ndarray, corr: np.ndarray) -> float:
+        """Compute portfolio variance Σᵢ Σⱼ wᵢ wⱼ σᵢ σⱼ ρᵢⱼ (NumPy fallback)."""
+        scaled = weights * volatilities
+        return float(np.einsum('i,j,ij->', scaled, scaled, corr))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def segment_compound(returns: np.ndarray, boundaries: np.ndarray) -> np.ndarray:
+        """
+        Compound returns within contiguous segments (e.g. calendar months).
+
+        Parameters:
+        -----------
+        returns : np.ndarray
+            1-D array of periodic returns (as decimals)
+        boundaries : np.ndarray
+            Sorted int64 segment start offsets followed by len(returns)
+
+        Returns:
+        --------
+        np.ndarray : Compounded return of each segment (as decimals)
+        """
+        n_segments = boundaries.size - 1
+        out = np.empty(n_segments)
+        for g in range(n_segments):
+            acc = 1.0
+            for i in range(boundaries[g], boundaries[g + 1]):
+                acc *= 1.0 + returns[i]
+            out[g] = acc - 1.0
+        return out
+else:
+    def segment_compound(returns: np.ndarray, boundaries: np.ndarray) -> np.ndarray:
+        """Compound returns within contiguous segments (NumPy fallback)."""
+        return np.expm1(np.add.reduceat(np.log1p(returns), boundaries[:-1]))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """
+        Select indices of a Largest-Triangle-Three-Buckets downsample.
+
+        Parameters:
+        -----------
+        x : np.ndarray
+            1-D monotonically increasing x values (float64)
+        y : np.ndarray
+            1-D y values (float64), same length as x
+        n_out : int
+            Number of points to keep (including the first and last)
+
+        Returns:
+        --------
+        np.ndarray : Sorted int64 indices of the points to keep
+        """
+        n = x.size
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+
+        out = np.empty(n_out, dtype=np.int64)
+        out[0] = 0
+        out[n_out - 1] = n - 1
+        bucket = (n - 2) / (n_out - 2)
+        a = 0
+
+        for i in range(n_out - 2):
+            start = int(i * bucket) + 1
+            end = int((i + 1) * bucket) + 1
+            next_end = min(int((i + 2) * bucket) + 1, n)
+
+            # Average of the next bucket is the third triangle vertex
+            avg_x = 0.0
+            avg_y = 0.0
+            for j in range(end, next_end):
+                avg_x += x[j]
+                avg_y += y[j]
+            count = next_end - end
+            avg_x /= count
+            avg_y /= count
+
+            best = start
+            best_area = -1.0
+            for j in range(start, end):
+                area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+                if area > best_area:
+                    best_area = area
+                    best = j
+
+            out[i + 1] = best
+            a = best
+
+        return out
+else:
+    def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """Select indices of a Largest-Triangle-Three-Buckets downsample (NumPy fallback)."""
+        n = x.size
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+
+        out = np.empty(n_out, dtype=np.int64)
+        out[0] = 0
+        out[n_out - 1] = n - 1
+        edges = (np.arange(n_out) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+        edges[-1] = n
+        a = 0
+
+        for i in range(n_out - 2):
+            start, end = edges[i], edges[i + 1]
+            next_end = edges[i + 2]
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+
+            area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                          - (x[a] - x[start:end]) * (avg_y - y[a]))
+            a = start + int(np.argmax(area))
+            out[i + 1] = a
+
+        return out
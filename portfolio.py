@@ -1,10 +1,65 @@
-import json
-import pandas as pd
+from __future__ import annotations
+
 import numpy as np
-from typing import Dict, List, Union, Optional
+from typing import Dict, List, Union, Optional, TYPE_CHECKING
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+from contextlib import contextmanager
 import warnings
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas is imported on first use so holdings/JSON-only callers skip its import cost
+_pandas = None
+
+
+def _pd():
+    """Return the pandas module, importing it on first use."""
+    global _pandas
+    if _pandas is None:
+        import pandas
+        _pandas = pandas
+    return _pandas
+
+
+# Both JSON backends write the same bytes: 2-space indent, UTF-8, no NaN/Infinity literals
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+    _json_loads = json.loads
+
+# Unbound str.upper, used to normalize ticker symbols without per-call attribute lookups
+_upper = str.upper
+
+# Holdings count from which the compiled variance kernel beats a single einsum
+_PVAR_KERNEL_MIN_ASSETS = 500
+
+# Planned batch_volatility einsum contraction paths, keyed by operand shapes
+_EINSUM_PATHS = {}
+
+
+def _variance(weights: np.ndarray, volatilities: np.ndarray, corr: np.ndarray) -> float:
+    """Portfolio variance (w*s)ᵀ C (w*s), using the compiled kernel for large portfolios."""
+    if len(weights) >= _PVAR_KERNEL_MIN_ASSETS:
+        # Imported lazily: loading kernels pulls in numba when it is installed
+        from kernels import NUMBA_AVAILABLE, portfolio_variance
+        if NUMBA_AVAILABLE:
+            return portfolio_variance(weights, volatilities, np.ascontiguousarray(corr))
+    scaled = weights * volatilities
+    return np.einsum('i,j,ij->', scaled, scaled, corr)
+
 
 class Portfolio:
     """
@@ -12,7 +67,8 @@ class Portfolio:
     Can be used with the financial analysis functions from your existing module.
     """
 
-    def __init__(self, holdings: Optional[Dict[str, float]] = None, name: str = "Portfolio"):
+    def __init__(self, holdings: Optional[Dict[str, float]] = None, name: str = "Portfolio",
+                 dtype: np.dtype = np.float64):
         """
         Initialize a Portfolio object.
 
@@ -23,23 +79,81 @@ class Portfolio:
             Example: {"AAPL": 0.3, "GOOGL": 0.5, "MSFT": 0.2}
         name : str, optional
             Name for the portfolio (default: "Portfolio")
+        dtype : np.dtype, optional
+            Floating dtype for weights, volatilities and correlations in metric
+            math (default: np.float64). np.float32 halves memory traffic for
+            large portfolios at ~1e-6 relative error in the results.
         """
         self.name = name
+        self._dtype = np.dtype(dtype)
         self.holdings = holdings if holdings is not None else {}
+        self._corr_np = None
+        self._corr_idx = {}
+        self._corr_source = None
+        self._cov = None
+        self._cov_idx = {}
+        self._cov_source = (None, None)
+        self._defer = False
         self._validate_weights()
 
+    @property
+    def holdings(self) -> Mapping[str, float]:
+        """
+        Holdings as a read-only {ticker: weight} mapping.
+
+        Tickers and weights are stored internally as parallel NumPy arrays, so
+        this is a snapshot that raises on assignment; change holdings with the
+        add/remove/update methods.
+        """
+        return MappingProxyType(dict(zip(self._tickers.tolist(), self._weights.tolist())))
+
+    @holdings.setter
+    def holdings(self, holdings: Dict[str, float]):
+        n = len(holdings)
+        self._tickers_buf = np.empty(n, dtype=object)
+        self._tickers_buf[:] = list(holdings)
+        self._weights_buf = np.fromiter(holdings.values(), dtype=self._dtype, count=n)
+        self._resize(n)
+        # ticker -> position in the arrays, so single-ticker lookups are O(1)
+        self._index = {ticker: i for i, ticker in enumerate(holdings)}
+
+    def _resize(self, n: int):
+        """Point _tickers/_weights at the first n slots of the (over-allocated) holdings buffers."""
+        self._tickers = self._tickers_buf[:n]
+        self._weights = self._weights_buf[:n]
+
+    def _weights_sum(self) -> float:
+        """Total of all holding weights, reduced in one pass over the weights array."""
+        return float(np.add.reduce(self._weights))
+
     def _validate_weights(self):
         """Validate that weights sum to approximately 1.0."""
-        if not self.holdings:
+        if self._defer or not self._weights.size:
             return
 
-        total = sum(self.holdings.values())
+        total = self._weights_sum()
         if not np.isclose(total, 1.0, atol=0.01):
             warnings.warn(
                 f"Portfolio weights sum to {total:.4f}, not 1.0. "
                 f"Consider normalizing with normalize_weights()."
             )
 
+    def _weighted_sum(self, df: Union[pd.DataFrame, pd.Series], column: Optional[str], label: str) -> float:
+        """
+        Weighted sum of one column of a ticker-indexed DataFrame (or of a ticker-indexed
+        Series, in which case column is ignored) as a single dot product.
+        Holdings missing from the data (or with NaN values) count as zero,
+        reported in one aggregate warning.
+        """
+        series = df if df.ndim == 1 else df[column]
+        values = series.reindex(self._tickers).to_numpy(dtype=self._dtype)
+        missing = np.isnan(values)
+        if missing.any():
+            warnings.warn(f"{int(missing.sum())} ticker(s) not found in {label} DataFrame: "
+                          f"{', '.join(self._tickers[missing])}.")
+            values = np.where(missing, 0.0, values)
+        return float(self._weights @ values)
+
     def add_ticker(self, ticker: str, weight: float):
         """
         Add a ticker to the portfolio with a specified weight.
@@ -51,58 +165,112 @@ class Portfolio:
         weight : float
             Weight/allocation for this ticker
         """
-        self.holdings[ticker.upper()] = weight
+        ticker_upper = _upper(ticker)
+        index = self._index.get(ticker_upper)
+        if index is not None:
+            self._weights[index] = weight
+        else:
+            n = len(self._tickers)
+            if n == len(self._tickers_buf):
+                # Grow the buffers geometrically so appends are amortized O(1)
+                capacity = max(8, 2 * n)
+                tickers_buf = np.empty(capacity, dtype=object)
+                weights_buf = np.empty(capacity, dtype=self._dtype)
+                tickers_buf[:n] = self._tickers
+                weights_buf[:n] = self._weights
+                self._tickers_buf, self._weights_buf = tickers_buf, weights_buf
+            self._tickers_buf[n] = ticker_upper
+            self._weights_buf[n] = weight
+            self._resize(n + 1)
+            self._index[ticker_upper] = n
+        self._validate_weights()
+
+    def add_tickers(self, holdings: Dict[str, float]):
+        """
+        Add several tickers at once, validating weights a single time.
+
+        Parameters:
+        -----------
+        holdings : dict
+            Dictionary of ticker: weight pairs to add (or overwrite)
+        """
+        merged = dict(self.holdings)
+        merged.update(zip(map(_upper, holdings), holdings.values()))
+        self.holdings = merged
         self._validate_weights()
 
+    @contextmanager
+    def defer_validation(self):
+        """
+        Context manager that suspends weight validation until the block exits.
+
+        Example:
+            with portfolio.defer_validation():
+                for ticker, weight in rows:
+                    portfolio.add_ticker(ticker, weight)
+        """
+        self._defer = True
+        try:
+            yield self
+        finally:
+            self._defer = False
+            self._validate_weights()
+
     def remove_ticker(self, ticker: str):
         """Remove a ticker from the portfolio."""
-        ticker_upper = ticker.upper()
-        if ticker_upper in self.holdings:
-            del self.holdings[ticker_upper]
+        ticker_upper = _upper(ticker)
+        index = self._index.pop(ticker_upper, None)
+        if index is not None:
+            # Shift the later holdings down one slot, keeping insertion order
+            n = len(self._tickers)
+            self._tickers_buf[index:n - 1] = self._tickers_buf[index + 1:n]
+            self._weights_buf[index:n - 1] = self._weights_buf[index + 1:n]
+            self._tickers_buf[n - 1] = None
+            self._resize(n - 1)
+            for i, moved in enumerate(self._tickers[index:].tolist(), index):
+                self._index[moved] = i
         else:
             warnings.warn(f"Ticker {ticker_upper} not found in portfolio.")
 
     def update_weight(self, ticker: str, new_weight: float):
         """Update the weight of an existing ticker."""
-        ticker_upper = ticker.upper()
-        if ticker_upper in self.holdings:
-            self.holdings[ticker_upper] = new_weight
+        ticker_upper = _upper(ticker)
+        index = self._index.get(ticker_upper)
+        if index is not None:
+            self._weights[index] = new_weight
             self._validate_weights()
         else:
             raise ValueError(f"Ticker {ticker_upper} not found in portfolio.")
 
     def normalize_weights(self):
         """Normalize weights to sum to 1.0."""
-        if not self.holdings:
+        if not self._weights.size:
             return
 
-        total = sum(self.holdings.values())
+        total = self._weights_sum()
         if total == 0:
             raise ValueError("Cannot normalize: total weight is zero.")
 
-        self.holdings = {ticker: weight / total for ticker, weight in self.holdings.items()}
+        self._weights /= total
 
     def get_tickers(self) -> List[str]:
         """Return list of tickers in the portfolio."""
-        return list(self.holdings.keys())
+        return self._tickers.tolist()
 
     def get_weights(self) -> List[float]:
         """Return list of weights corresponding to tickers."""
-        return list(self.holdings.values())
+        return self._weights.tolist()
 
     def get_holdings_df(self) -> pd.DataFrame:
-        """Return holdings as a DataFrame."""
-        return pd.DataFrame.from_dict(
-            self.holdings,
-            orient="index",
-            columns=["Weight"]
-        ).sort_values("Weight", ascending=False)
+        """Return holdings as a DataFrame, sorted by descending weight."""
+        order = np.argsort(-self._weights, kind="stable")
+        return _pd().DataFrame({"Weight": self._weights[order]}, index=self._tickers[order])
 
     def to_dict(self) -> Dict:
         """Export portfolio to dictionary format."""
         return {
             "name": self.name,
-            "holdings": self.holdings
+            "holdings": dict(self.holdings)
         }
 
     def to_json(self, filepath: Union[str, Path]):
@@ -114,8 +282,12 @@ class Portfolio:
         filepath : str or Path
             Path where the JSON file will be saved
         """
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=4)
+        data = self.to_dict()
+        # JSON has no NaN/Infinity, so non-finite weights are written as null (read back as NaN)
+        data["holdings"] = {ticker: weight if np.isfinite(weight) else None
+                            for ticker, weight in data["holdings"].items()}
+        with open(filepath, 'wb') as f:
+            f.write(_json_dumps(data))
         print(f"Portfolio saved to {filepath}")
 
     @classmethod
@@ -132,8 +304,9 @@ class Portfolio:
         --------
         Portfolio object
         """
+        holdings = data.get("holdings", {})
         return cls(
-            holdings=data.get("holdings", {}),
+            holdings={ticker: np.nan if weight is None else weight for ticker, weight in holdings.items()},
             name=data.get("name", "Portfolio")
         )
 
@@ -151,8 +324,8 @@ class Portfolio:
         --------
         Portfolio object
         """
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = _json_loads(f.read())
         return cls.from_dict(data)
 
     def portfolio_return(self, returns_df: pd.DataFrame) -> pd.Series:
@@ -169,17 +342,99 @@ class Portfolio:
         --------
         pd.Series with portfolio return
         """
-        portfolio_return = 0.0
-        for ticker, weight in self.holdings.items():
-            if ticker in returns_df.index:
-                portfolio_return += weight * returns_df.loc[ticker].iloc[0]
-            else:
-                warnings.warn(f"Ticker {ticker} not found in returns DataFrame.")
+        portfolio_return = self._weighted_sum(returns_df, returns_df.columns[0], "returns")
+        return _pd().Series({"PortfolioReturn": portfolio_return})
+
+    def set_correlation(self, correlation_matrix: pd.DataFrame):
+        """
+        Pre-align a correlation matrix to the current holdings for reuse.
+
+        The matching sub-matrix is stored as a C-contiguous array in the
+        portfolio's dtype and used by portfolio_volatility when it is called
+        without a matrix (or with this same matrix), skipping the per-call
+        .loc alignment.
 
-        return pd.Series({"PortfolioReturn": portfolio_return})
+        Parameters:
+        -----------
+        correlation_matrix : pd.DataFrame
+            Correlation matrix between tickers (must cover all holdings)
+        """
+        tickers = self._tickers.tolist()
+        sub = correlation_matrix.loc[tickers, tickers]
+        self._corr_np = np.ascontiguousarray(sub.to_numpy(), dtype=self._dtype)
+        self._corr_idx = {ticker: i for i, ticker in enumerate(tickers)}
+        self._corr_source = correlation_matrix
+
+    def _aligned_correlation(self, tickers: np.ndarray,
+                             correlation_matrix: Optional[pd.DataFrame]) -> np.ndarray:
+        """Return the correlation sub-matrix for tickers, from the cache when possible."""
+        if self._corr_np is not None and (correlation_matrix is None
+                                          or correlation_matrix is self._corr_source):
+            idx = [self._corr_idx.get(ticker) for ticker in tickers]
+            if None not in idx:
+                if idx == list(range(len(self._corr_idx))):
+                    return self._corr_np
+                return self._corr_np[np.ix_(idx, idx)]
+        if correlation_matrix is None:
+            raise ValueError("No correlation matrix given; pass one or call set_correlation() first.")
+        return correlation_matrix.loc[tickers, tickers].to_numpy(dtype=self._dtype)
+
+    def _period_volatilities(self, returns_series: Union[Dict[str, pd.Series], pd.DataFrame],
+                             tickers: np.ndarray) -> np.ndarray:
+        """Per-ticker (non-annualized) return volatilities, aligned with tickers."""
+        if not isinstance(returns_series, Mapping):
+            # DataFrame: one column-wise reduction instead of a pandas .std() per ticker
+            returns_arr = returns_series[list(tickers)].to_numpy(dtype=np.float64, copy=False)
+            std = np.nanstd if np.isnan(returns_arr).any() else np.std
+            return std(returns_arr, axis=0, ddof=1).astype(self._dtype, copy=False)
+        return np.array([returns_series[ticker].std() for ticker in tickers], dtype=self._dtype)
+
+    def precompute_cov(self, returns_series: Union[Dict[str, pd.Series], pd.DataFrame],
+                       correlation_matrix: pd.DataFrame) -> np.ndarray:
+        """
+        Precompute and cache the covariance matrix Σ = (σσᵀ) ∘ C for the holdings.
+
+        Subsequent portfolio_volatility calls with no data (or with these same
+        objects) reduce to √(wᵀ Σ w), which makes re-evaluating many weight
+        vectors against one returns dataset cheap.
+
+        Parameters:
+        -----------
+        returns_series : dict or pd.DataFrame
+            Return series for every holding (dict of Series or DataFrame columns)
+        correlation_matrix : pd.DataFrame
+            Correlation matrix between tickers (must cover all holdings)
 
-    def portfolio_volatility(self, returns_series: Dict[str, pd.Series],
-                             correlation_matrix: pd.DataFrame,
+        Returns:
+        --------
+        np.ndarray : Period (non-annualized) covariance matrix, in holdings order
+        """
+        tickers = self._tickers.tolist()
+        volatilities = self._period_volatilities(returns_series, self._tickers)
+        corr = correlation_matrix.loc[tickers, tickers].to_numpy(dtype=self._dtype)
+        self._cov = np.ascontiguousarray(np.outer(volatilities, volatilities) * corr)
+        self._cov_idx = {ticker: i for i, ticker in enumerate(tickers)}
+        self._cov_source = (returns_series, correlation_matrix)
+        return self._cov
+
+    def _cached_variance(self, returns_series, correlation_matrix) -> Optional[float]:
+        """Portfolio variance from the precompute_cov() matrix, or None if it does not apply."""
+        if self._cov is None:
+            return None
+        source_returns, source_corr = self._cov_source
+        if ((returns_series is not None and returns_series is not source_returns)
+                or (correlation_matrix is not None and correlation_matrix is not source_corr)):
+            return None
+
+        idx = [self._cov_idx.get(ticker) for ticker in self._tickers.tolist()]
+        if None in idx:
+            return None
+        cov = self._cov if idx == list(range(len(self._cov_idx))) else self._cov[np.ix_(idx, idx)]
+        # Σ = (σσᵀ) ∘ C, so unit volatilities let large portfolios use the upper-triangle kernel
+        return float(_variance(self._weights, np.ones_like(self._weights), cov))
+
+    def portfolio_volatility(self, returns_series: Optional[Union[Dict[str, pd.Series], pd.DataFrame]] = None,
+                             correlation_matrix: Optional[pd.DataFrame] = None,
                              annualize: bool = True,
                              periods_per_year: int = 252) -> float:
         """
@@ -190,10 +445,13 @@ class Portfolio:
 
         Parameters:
         -----------
-        returns_series : dict
-            Dictionary mapping tickers to their return series
-        correlation_matrix : pd.DataFrame
-            Correlation matrix between tickers
+        returns_series : dict or pd.DataFrame, optional
+            Dictionary mapping tickers to their return series, or a DataFrame
+            of returns with one column per ticker. If None, the covariance
+            matrix stored by precompute_cov() is used.
+        correlation_matrix : pd.DataFrame, optional
+            Correlation matrix between tickers. If None, the matrix stored by
+            set_correlation() (or precompute_cov()) is used.
         annualize : bool, optional
             Whether to annualize the volatility (default: True)
         periods_per_year : int, optional
@@ -203,21 +461,24 @@ class Portfolio:
         --------
         float : Portfolio volatility (annualized if annualize=True)
         """
-        # Calculate individual volatilities (period volatility, not annualized)
-        volatilities = {ticker: returns.std() for ticker, returns in returns_series.items()}
-
-        # Calculate portfolio variance
-        portfolio_variance = 0.0
-        for ticker_i, weight_i in self.holdings.items():
-            for ticker_j, weight_j in self.holdings.items():
-                if ticker_i in volatilities and ticker_j in volatilities:
-                    vol_i = volatilities[ticker_i]
-                    vol_j = volatilities[ticker_j]
-                    corr_ij = correlation_matrix.loc[ticker_i, ticker_j]
-                    portfolio_variance += weight_i * weight_j * vol_i * vol_j * corr_ij
+        # Reuse the precomputed covariance matrix when it matches the inputs
+        variance = self._cached_variance(returns_series, correlation_matrix)
+        if variance is None:
+            if returns_series is None:
+                raise ValueError("No returns given; pass returns_series or call precompute_cov() first.")
+
+            # Align weights, period volatilities and correlations once
+            mask = np.fromiter((ticker in returns_series for ticker in self._tickers),
+                               dtype=bool, count=len(self._tickers))
+            tickers, weights = self._tickers[mask], self._weights[mask]
+            volatilities = self._period_volatilities(returns_series, tickers)
+            corr = self._aligned_correlation(tickers, correlation_matrix)
+
+            # Portfolio variance = (w*s)ᵀ C (w*s)
+            variance = _variance(weights, volatilities, corr)
 
         # Portfolio standard deviation (period level)
-        portfolio_std = np.sqrt(portfolio_variance)
+        portfolio_std = np.sqrt(variance)
 
         # Annualize if requested
         if annualize:
@@ -225,7 +486,7 @@ class Portfolio:
 
         return portfolio_std
 
-    def portfolio_beta(self, beta_df: pd.DataFrame, beta_column: Optional[str] = None) -> float:
+    def portfolio_beta(self, beta_df: Union[pd.DataFrame, pd.Series], beta_column: Optional[str] = None) -> float:
         """
         Calculate portfolio beta as the weighted average of individual stock betas.
 
@@ -233,29 +494,23 @@ class Portfolio:
 
         Parameters:
         -----------
-        beta_df : pd.DataFrame
-            DataFrame with tickers as index and beta values
+        beta_df : pd.DataFrame or pd.Series
+            DataFrame (or Series) with tickers as index and beta values
             (e.g., output from beta_single_stock for each ticker)
         beta_column : str, optional
             Name of the column containing beta values. If None, uses first column.
+            Ignored for a Series.
 
         Returns:
         --------
         float : Portfolio beta
         """
-        if beta_column is None:
+        if beta_column is None and beta_df.ndim == 2:
             beta_column = beta_df.columns[0]
 
-        portfolio_beta_value = 0.0
-        for ticker, weight in self.holdings.items():
-            if ticker in beta_df.index:
-                portfolio_beta_value += weight * beta_df.loc[ticker, beta_column]
-            else:
-                warnings.warn(f"Ticker {ticker} not found in beta DataFrame.")
-
-        return portfolio_beta_value
+        return self._weighted_sum(beta_df, beta_column, "beta")
 
-    def portfolio_alpha(self, alpha_df: pd.DataFrame, alpha_column: Optional[str] = None) -> float:
+    def portfolio_alpha(self, alpha_df: Union[pd.DataFrame, pd.Series], alpha_column: Optional[str] = None) -> float:
         """
         Calculate portfolio alpha as the weighted average of individual stock alphas.
 
@@ -263,27 +518,21 @@ class Portfolio:
 
         Parameters:
         -----------
-        alpha_df : pd.DataFrame
-            DataFrame with tickers as index and alpha values
+        alpha_df : pd.DataFrame or pd.Series
+            DataFrame (or Series) with tickers as index and alpha values
             (e.g., output from alpha_single_stock for each ticker)
         alpha_column : str, optional
             Name of the column containing alpha values. If None, uses first column.
+            Ignored for a Series.
 
         Returns:
         --------
         float : Portfolio alpha
         """
-        if alpha_column is None:
+        if alpha_column is None and alpha_df.ndim == 2:
             alpha_column = alpha_df.columns[0]
 
-        portfolio_alpha_value = 0.0
-        for ticker, weight in self.holdings.items():
-            if ticker in alpha_df.index:
-                portfolio_alpha_value += weight * alpha_df.loc[ticker, alpha_column]
-            else:
-                warnings.warn(f"Ticker {ticker} not found in alpha DataFrame.")
-
-        return portfolio_alpha_value
+        return self._weighted_sum(alpha_df, alpha_column, "alpha")
 
     def portfolio_sharpe_ratio(self, sharpe_df: pd.DataFrame, sharpe_column: Optional[str] = None) -> float:
         """
@@ -307,14 +556,7 @@ class Portfolio:
         if sharpe_column is None:
             sharpe_column = sharpe_df.columns[0]
 
-        portfolio_sharpe_value = 0.0
-        for ticker, weight in self.holdings.items():
-            if ticker in sharpe_df.index:
-                portfolio_sharpe_value += weight * sharpe_df.loc[ticker, sharpe_column]
-            else:
-                warnings.warn(f"Ticker {ticker} not found in Sharpe DataFrame.")
-
-        return portfolio_sharpe_value
+        return self._weighted_sum(sharpe_df, sharpe_column, "Sharpe")
 
     def portfolio_sharpe_ratio_true(self, portfolio_return: float, risk_free_rate: float,
                                     portfolio_volatility: float) -> float:
@@ -374,9 +616,181 @@ class Portfolio:
 
         return (portfolio_return - risk_free_rate) / portfolio_beta
 
+    def metrics(self, returns_df: pd.DataFrame, correlation_matrix: Optional[pd.DataFrame],
+                beta_df: Union[pd.DataFrame, pd.Series], alpha_df: Union[pd.DataFrame, pd.Series],
+                risk_free_rate: float, periods_per_year: int = 252) -> Dict[str, float]:
+        """
+        Calculate return, volatility, beta, alpha, Sharpe and Treynor ratios together.
+
+        Holdings are aligned against the inputs once and every metric is derived
+        from the same weight/return/covariance arrays, instead of each
+        portfolio_* method re-aligning the holdings separately.
+
+        Parameters:
+        -----------
+        returns_df : pd.DataFrame
+            Periodic returns with one column per holding (no missing values)
+        correlation_matrix : pd.DataFrame, optional
+            Correlation matrix between tickers. If None, the sample covariance
+            of returns_df is used directly.
+        beta_df : pd.DataFrame or pd.Series
+            DataFrame with tickers as index and beta values in the first column,
+            or a ticker-indexed Series of betas
+        alpha_df : pd.DataFrame or pd.Series
+            DataFrame with tickers as index and alpha values in the first column,
+            or a ticker-indexed Series of alphas
+        risk_free_rate : float
+            Annualized risk-free rate (e.g., from SOFR)
+        periods_per_year : int, optional
+            Number of periods per year for annualization (default: 252 for daily)
+
+        Returns:
+        --------
+        dict : Return, Volatility, Beta, Alpha, SharpeRatio and TreynorRatio
+        """
+        weights = self._weights.astype(np.float64, copy=False)
+        returns_arr = returns_df[self._tickers.tolist()].to_numpy(dtype=np.float64, copy=False)
+
+        # Annualized cumulative return per ticker (compounded in log space)
+        growth = np.exp(np.log1p(returns_arr).sum(axis=0))
+        annual_returns = growth ** (periods_per_year / returns_arr.shape[0]) - 1
+
+        # Period covariance of the holdings
+        if correlation_matrix is None:
+            cov = np.atleast_2d(np.cov(returns_arr, rowvar=False, ddof=1))
+        else:
+            volatilities = returns_arr.std(axis=0, ddof=1)
+            corr = self._aligned_correlation(self._tickers, correlation_matrix)
+            cov = np.outer(volatilities, volatilities) * corr
+
+        portfolio_return = float(weights @ annual_returns)
+        volatility = float(np.sqrt(weights @ cov @ weights) * np.sqrt(periods_per_year))
+        beta = self.portfolio_beta(beta_df)
+        alpha = self.portfolio_alpha(alpha_df)
+
+        return {
+            "Return": portfolio_return,
+            "Volatility": volatility,
+            "Beta": beta,
+            "Alpha": alpha,
+            "SharpeRatio": self.portfolio_sharpe_ratio_true(portfolio_return, risk_free_rate, volatility),
+            "TreynorRatio": self.portfolio_treynor_ratio(portfolio_return, risk_free_rate, beta)
+        }
+
+    @staticmethod
+    def batch_volatility(weights: np.ndarray, cov: np.ndarray,
+                         annualize: bool = True, periods_per_year: int = 252) -> np.ndarray:
+        """
+        Calculate volatilities for many candidate weight vectors at once.
+
+        Parameters:
+        -----------
+        weights : np.ndarray
+            (K, N) array with one candidate weight vector per row
+        cov : np.ndarray
+            (N, N) period covariance matrix (e.g. from precompute_cov())
+        annualize : bool, optional
+            Whether to annualize the volatilities (default: True)
+        periods_per_year : int, optional
+            Number of periods per year for annualization (default: 252 for daily)
+
+        Returns:
+        --------
+        np.ndarray : (K,) portfolio volatilities
+        """
+        # Contraction order depends only on the operand shapes, so plan it once per shape
+        shapes = (weights.shape, cov.shape)
+        path = _EINSUM_PATHS.get(shapes)
+        if path is None:
+            path = np.einsum_path('ki,ij,kj->k', weights, cov, weights, optimize='optimal')[0]
+            _EINSUM_PATHS[shapes] = path
+        variances = np.einsum('ki,ij,kj->k', weights, cov, weights, optimize=path)
+        volatilities = np.sqrt(variances)
+        if annualize:
+            volatilities *= np.sqrt(periods_per_year)
+        return volatilities
+
+    @staticmethod
+    def batch_return(weights: np.ndarray, returns: np.ndarray) -> np.ndarray:
+        """
+        Calculate returns for many candidate weight vectors at once.
+
+        Parameters:
+        -----------
+        weights : np.ndarray
+            (K, N) array with one candidate weight vector per row
+        returns : np.ndarray
+            (N,) per-ticker returns aligned with the weight columns
+
+        Returns:
+        --------
+        np.ndarray : (K,) portfolio returns
+        """
+        return weights @ returns
+
+    @staticmethod
+    def _batch_excess_ratio(returns: np.ndarray, risk_free_rate: Union[float, np.ndarray],
+                            denominator: np.ndarray) -> np.ndarray:
+        """
+        (returns - risk_free_rate) / denominator without branching per element.
+        Zero denominators give inf for positive excess return and 0 otherwise.
+        """
+        excess, denominator = np.broadcast_arrays(np.asarray(returns, dtype=np.float64) - risk_free_rate,
+                                                  np.asarray(denominator, dtype=np.float64))
+        out = np.where(excess > 0, np.inf, 0.0)
+        np.divide(excess, denominator, out=out, where=denominator != 0)
+        return out
+
+    @staticmethod
+    def batch_sharpe_true(returns: np.ndarray, risk_free_rate: Union[float, np.ndarray],
+                          volatilities: np.ndarray) -> np.ndarray:
+        """
+        Vectorized portfolio_sharpe_ratio_true for many candidates at once.
+
+        Unlike the scalar version, zero volatilities do not emit warnings.
+
+        Parameters:
+        -----------
+        returns : np.ndarray
+            Annualized returns per candidate (e.g. from batch_return())
+        risk_free_rate : float or np.ndarray
+            Annualized risk-free rate
+        volatilities : np.ndarray
+            Volatilities per candidate (e.g. from batch_volatility())
+
+        Returns:
+        --------
+        np.ndarray : Sharpe ratio per candidate
+        """
+        return Portfolio._batch_excess_ratio(returns, risk_free_rate, volatilities)
+
+    @staticmethod
+    def batch_treynor_ratio(returns: np.ndarray, risk_free_rate: Union[float, np.ndarray],
+                            betas: np.ndarray) -> np.ndarray:
+        """
+        Vectorized portfolio_treynor_ratio for many candidates at once.
+
+        Unlike the scalar version, zero betas do not emit warnings.
+
+        Parameters:
+        -----------
+        returns : np.ndarray
+            Annualized returns per candidate (e.g. from batch_return())
+        risk_free_rate : float or np.ndarray
+            Annualized risk-free rate
+        betas : np.ndarray
+            Portfolio beta per candidate
+
+        Returns:
+        --------
+        np.ndarray : Treynor ratio per candidate
+        """
+        return Portfolio._batch_excess_ratio(returns, risk_free_rate, betas)
+
     def __repr__(self):
-        holdings_str = "\n".join([f"  {ticker}: {weight:.4f}" for ticker, weight in self.holdings.items()])
-        return f"Portfolio: {self.name}\nHoldings:\n{holdings_str}\nTotal Weight: {sum(self.holdings.values()):.4f}"
+        holdings_str = "\n".join([f"  {ticker}: {weight:.4f}"
+                                  for ticker, weight in zip(self._tickers.tolist(), self._weights.tolist())])
+        return f"Portfolio: {self.name}\nHoldings:\n{holdings_str}\nTotal Weight: {self._weights_sum():.4f}"
 
     def __str__(self):
         return self.__repr__()
@@ -418,7 +832,7 @@ def equal_weight_portfolio(tickers: List[str], name: str = "Equal Weight Portfol
         raise ValueError("Ticker list cannot be empty.")
 
     weight = 1.0 / n
-    holdings = {ticker.upper(): weight for ticker in tickers}
+    holdings = dict.fromkeys(map(_upper, tickers), weight)
     return Portfolio(holdings=holdings, name=name)
 
 
@@ -426,9 +840,10 @@ if __name__ == "__main__":
     # Example 1: Create portfolio manually
     print("=== Example 1: Manual Creation ===")
     portfolio1 = Portfolio(name="My Tech Portfolio")
-    portfolio1.add_ticker("AAPL", 0.4)
-    portfolio1.add_ticker("GOOGL", 0.35)
-    portfolio1.add_ticker("MSFT", 0.25)
+    with portfolio1.defer_validation():
+        portfolio1.add_ticker("AAPL", 0.4)
+        portfolio1.add_ticker("GOOGL", 0.35)
+        portfolio1.add_ticker("MSFT", 0.25)
     print(portfolio1)
     print()
 
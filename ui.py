@@ -1,16 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+from collections import deque
 import json
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import sys
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 # Import Portfolio class and utils from your existing code
 try:
     from portfolio import Portfolio
+    import kernels
     import utils
     from utils import (
         annualized_cumulative_return,
@@ -28,10 +36,117 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Default analysis end date, evaluated once at startup
+_TODAY_STR = datetime.now().strftime("%Y-%m-%d")
+
+# Console log: lines kept in the widget and delay before buffered messages are written
+_CONSOLE_MAX_LINES = 1000
+_CONSOLE_FLUSH_MS = 100
+
+_LOG_LEVEL_INDICATORS = {
+    "INFO": "ℹ",
+    "SUCCESS": "✓",
+    "WARNING": "⚠",
+    "ERROR": "✗"
+}
+
+# Rows read per chunk when importing holdings from CSV
+_CSV_IMPORT_CHUNK_ROWS = 50_000
+
+# (second, "HH:MM:SS") of the last console timestamp, so bursts of log lines format it once
+_ts_cache = [0, ""]
+
+
+def _console_timestamp() -> str:
+    """Return the current local time as HH:MM:SS, reformatting at most once per second."""
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache[1] = time.strftime("%H:%M:%S", time.localtime(sec))
+        _ts_cache[0] = sec
+    return _ts_cache[1]
+
+
+# Number of recent analysis results kept for repeated runs with identical inputs
+_ANALYSIS_CACHE_SIZE = 8
+
+# Interval at which the Tk main thread checks whether a running analysis has finished
+_ANALYSIS_POLL_MS = 50
+
+# Tcl variable holding the available tickers as a Tcl list
+_TICKERS_TCL_VAR = "::portfolio_available_tickers"
+
+# Tcl variable used to hand a batch of (ticker, weight) rows to the holdings treeview
+_HOLDINGS_ROWS_TCL_VAR = "::portfolio_holdings_rows"
+
+# Fixed part of the results report, formatted in one call. Styled spans are wrapped as
+# \x01tag\x02text\x03 and split into (text, tag) pairs by _TAG_SPAN afterwards.
+_RESULTS_TEMPLATE = (
+    "\x01header\x02" + "=" * 80 + "\nPORTFOLIO ANALYSIS RESULTS\n" + "=" * 80 + "\n\n\x03"
+    "\x01subheader\x02Simulation Parameters:\n\x03"
+    "  Period: {start_date} to {end_date}\n"
+    "  Frequency: {frequency}\n"
+    "  Market Benchmark: {market_ticker}\n"
+    "  Risk-Free Rate: {risk_free_rate:.4f} ({risk_free_rate:.2%})\n\n"
+    "\x01subheader\x02Portfolio-Level Metrics (Frequency: {analysis_freq}):\n\x03"
+    "  Annual Return:      \x01value\x02{portfolio_return:.4f} ({portfolio_return:.2%})\n\x03"
+    "  Volatility (Ann.):  \x01value\x02{portfolio_volatility:.4f} ({portfolio_volatility:.2%})\n\x03"
+    "  Sharpe Ratio:       \x01value\x02{portfolio_sharpe:.4f}\n\x03"
+    "  Beta (β):           \x01value\x02{portfolio_beta:.4f}\n\x03"
+    "  Alpha (α):          \x01value\x02{portfolio_alpha:.4f} ({portfolio_alpha:.2%})\n\x03"
+    "  Treynor Ratio:      \x01value\x02{portfolio_treynor:.4f}\n\x03"
+    "  Max Drawdown:       \x01value\x02{max_drawdown:.4f} ({max_drawdown:.2%})\n\x03"
+    "  % From Highwater:   \x01value\x02{pct_from_hwm:.4f} ({pct_from_hwm:.2%})\n\n\x03"
+    "\x01subheader\x02Daily Return Statistics:\n\x03"
+    "  Daily Std Dev:      \x01value\x02{daily_std:.2%}\n\x03"
+    "  Minimum Return:     \x01value\x02{daily_min:.2%}\n\x03"
+    "  Maximum Return:     \x01value\x02{daily_max:.2%}\n\n\x03"
+    "  % of Up Days:       \x01value\x02{up_days_pct:.1%}\n\x03"
+    "  25th Percentile:    \x01value\x02{daily_25:.2%}\n\x03"
+    "  Median (50th):      \x01value\x02{daily_median:.2%}\n\x03"
+    "  75th Percentile:    \x01value\x02{daily_75:.2%}\n\n\x03"
+    "  Skewness:           \x01value\x02{daily_skew:.4f}\n\x03"
+    "  Kurtosis:           \x01value\x02{daily_kurt:.4f}\n\n\x03"
+    "\x01subheader\x02Individual Ticker Metrics:\n\x03"
+    + "-" * 80 + "\n"
+    + f"{'Ticker':<8} {'Return':<12} {'Volatility':<12} {'Sharpe':<10} {'Beta':<10} {'Alpha':<10}\n"
+    + "-" * 80 + "\n"
+)
+_TAG_SPAN = re.compile(r"\x01(\w+)\x02(.*?)\x03", re.DOTALL)
+
+
+def _set_combobox_values(combo: ttk.Combobox, tcl_var: str):
+    """Point a combobox's values at a Tcl list variable without a round-trip through Python."""
+    combo.tk.eval(f"{combo} configure -values ${{{tcl_var}}}")
+
+
+@lru_cache(maxsize=8)
+def _scan_ticker_dir(data_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    List the tickers with a CSV file in a data directory, sorted.
+
+    The directory mtime is part of the cache key, so adding or removing
+    a CSV file invalidates the cached listing.
+    """
+    return tuple(sorted(file.stem for file in Path(data_dir).glob("*.csv")))
+
+
+def _sample_skew_kurtosis(n: int, m2: float, m3: float, m4: float) -> Tuple[float, float]:
+    """
+    Bias-corrected sample skewness and excess kurtosis from the central moments of
+    n returns (the same estimators as pandas Series.skew() and Series.kurt()).
+    """
+    if m2 == 0:
+        return 0.0, 0.0
+
+    skew = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5 if n >= 3 else np.nan
+    kurt = (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * (m4 / (m2 * m2) - 3.0) + 6.0) if n >= 4 else np.nan
+    return skew, kurt
+
+
 class TickerEntryDialog:
     """Dialog for adding or editing a ticker entry."""
 
-    def __init__(self, parent, available_tickers, ticker="", weight=0.0, title="Add Ticker"):
+    def __init__(self, parent, tickers_var, ticker="", weight=0.0, title="Add Ticker"):
         self.result = None
         self.top = tk.Toplevel(parent)
         self.top.title(title)
@@ -58,10 +173,10 @@ class TickerEntryDialog:
         self.ticker_combo = ttk.Combobox(
             main_frame,
             textvariable=self.ticker_var,
-            values=available_tickers,
             font=("Arial", 11),
             width=20
         )
+        _set_combobox_values(self.ticker_combo, tickers_var)
         self.ticker_combo.grid(row=0, column=1, sticky=tk.EW, padx=10, pady=10)
         self.ticker_combo.focus()
 
@@ -127,6 +242,7 @@ class PortfolioManagerUI:
         # Data storage paths
         self.portfolios_dir = Path("user_data/portfolios")
         self.portfolios_dir.mkdir(parents=True, exist_ok=True)
+        self._portfolios_dir_mtime: Optional[int] = None  # as of the last portfolio list refresh
 
         # Current portfolio being edited
         self.current_portfolio: Optional[Portfolio] = None
@@ -141,30 +257,62 @@ class PortfolioManagerUI:
         self.portfolio_daily_returns: Optional[pd.Series] = None
         self.benchmark_daily_returns: Optional[pd.Series] = None
 
+        # Shadow of the holdings treeview: ticker -> tree item id, plus parallel
+        # ticker list / weight array (in %) that the treeview rows mirror and
+        # ticker -> position in them
+        self._ticker_index: Dict[str, str] = {}
+        self._tickers_list: List[str] = []
+        self._ticker_pos: Dict[str, int] = {}
+        self._weights_arr = np.empty(0)
+
+        # Running sum of the displayed holding weights (in %)
+        self._weight_total = 0.0
+
+        # Whether the holdings changed since current_portfolio was last saved/loaded
+        self._ui_dirty = False
+
+        # Next sort direction per holdings column (False = ascending)
+        self._sort_reverse: Dict[str, bool] = {}
+
+        # Pending console messages, written in batches by _flush_console
+        self._log_buf = deque()
+        self._log_flush_pending = False
+
+        # Latest status bar text, applied once per idle tick by _flush_status
+        self._pending_status: Optional[str] = None
+        self._status_scheduled = False
+
+        # Worker so analysis runs off the Tk main thread (one analysis at a time)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Recent analysis results keyed on (name, holdings, dates, frequency, market, source)
+        self._analysis_cache: Dict[Tuple, Tuple[pd.Series, pd.Series, Dict]] = {}
+
         # Available tickers (you can expand this or load from database)
         self.available_tickers = self._load_available_tickers()
+        # Convert the ticker list to a Tcl list once so every combobox shares it
+        self.root.setvar(_TICKERS_TCL_VAR, self.available_tickers)
 
         self._setup_ui()
         self._load_portfolio_list()
 
-    def _load_available_tickers(self) -> List[str]:
+    def _load_available_tickers(self) -> Tuple[str, ...]:
         """Load available tickers from data directory or hardcoded list."""
         # Retrieve the configured data directory from utils
         data_dir = Path(utils.get_data_dir())
 
         if data_dir.exists():
-            tickers = []
-            for file in data_dir.glob("*.csv"):
-                tickers.append(file.stem)
+            tickers = _scan_ticker_dir(str(data_dir), data_dir.stat().st_mtime_ns)
             if tickers:
-                return sorted(tickers)
+                return tickers
 
         # Fallback to common tickers
-        return sorted([
+        return tuple(sorted([
             "AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "NVDA", "META", "NFLX",
             "AMD", "INTC", "JPM", "BAC", "GS", "MS", "V", "MA", "SPY", "QQQ",
             "DIA", "IWM", "BRK.B", "JNJ", "PG", "KO", "PEP", "WMT", "HD", "DIS"
-        ])
+        ]))
 
     def _setup_ui(self):
         """Setup the main UI layout."""
@@ -323,8 +471,8 @@ class PortfolioManagerUI:
         )
 
         # Configure columns
-        self.holdings_tree.heading("Ticker", text="Ticker", command=lambda: self._sort_column("Ticker", False))
-        self.holdings_tree.heading("Weight", text="Weight (%)", command=lambda: self._sort_column("Weight", False))
+        self.holdings_tree.heading("Ticker", text="Ticker", command=lambda: self._sort_column("Ticker"))
+        self.holdings_tree.heading("Weight", text="Weight (%)", command=lambda: self._sort_column("Weight"))
 
         self.holdings_tree.column("Ticker", width=150, anchor=tk.CENTER)
         self.holdings_tree.column("Weight", width=150, anchor=tk.CENTER)
@@ -398,7 +546,7 @@ class PortfolioManagerUI:
 
         ttk.Label(date_frame, text="End Date:", width=12).pack(side=tk.LEFT, padx=5)
         self.end_date_entry = ttk.Entry(date_frame, width=12)
-        self.end_date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.end_date_entry.insert(0, _TODAY_STR)
         self.end_date_entry.pack(side=tk.LEFT, padx=5)
 
         # Frequency
@@ -413,8 +561,8 @@ class PortfolioManagerUI:
 
         ttk.Label(freq_frame, text="Market Ticker:", width=12).pack(side=tk.LEFT, padx=5)
         self.market_ticker_var = tk.StringVar(value="SPY")
-        market_combo = ttk.Combobox(freq_frame, textvariable=self.market_ticker_var,
-                                    values=self.available_tickers, width=12)
+        market_combo = ttk.Combobox(freq_frame, textvariable=self.market_ticker_var, width=12)
+        _set_combobox_values(market_combo, _TICKERS_TCL_VAR)
         market_combo.pack(side=tk.LEFT, padx=5)
 
         # Use CSV checkbox
@@ -422,8 +570,9 @@ class PortfolioManagerUI:
         ttk.Checkbutton(freq_frame, text="Use CSV data", variable=self.use_csv_var).pack(side=tk.LEFT, padx=10)
 
         # Run simulation button
-        ttk.Button(params_frame, text="Run Analysis", command=self._run_analysis,
-                   style="Accent.TButton").pack(pady=10)
+        self.run_analysis_button = ttk.Button(params_frame, text="Run Analysis", command=self._run_analysis,
+                                              style="Accent.TButton")
+        self.run_analysis_button.pack(pady=10)
 
         # Create subtabs for results and charting
         self.analysis_notebook = ttk.Notebook(self.analysis_tab)
@@ -492,45 +641,119 @@ class PortfolioManagerUI:
         )
         self.chart_placeholder.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
 
-    def _sort_column(self, col, reverse):
-        """Sort treeview by column."""
+    def _sort_column(self, col):
+        """Sort treeview by column, alternating ascending/descending on each call."""
         self._log_to_console(f"Sorted holdings by {col}", "INFO")
-        data = [(self.holdings_tree.set(child, col), child) for child in self.holdings_tree.get_children('')]
+        reverse = self._sort_reverse.get(col, False)
 
-        # Sort numerically for Weight column
+        # Order the shadow arrays rather than reading every cell back from the treeview
         if col == "Weight":
-            data.sort(key=lambda x: float(x[0]), reverse=reverse)
+            order = np.argsort(-self._weights_arr if reverse else self._weights_arr, kind="stable")
         else:
-            data.sort(reverse=reverse)
+            order = sorted(range(len(self._tickers_list)), key=self._tickers_list.__getitem__, reverse=reverse)
+
+        self._tickers_list = [self._tickers_list[i] for i in order]
+        self._weights_arr = self._weights_arr[order]
+        self._ticker_pos = {ticker: pos for pos, ticker in enumerate(self._tickers_list)}
 
-        for index, (_, child) in enumerate(data):
-            self.holdings_tree.move(child, '', index)
+        with self._bulk_tree_update():
+            for index, ticker in enumerate(self._tickers_list):
+                self.holdings_tree.move(self._ticker_index[ticker], '', index)
 
         # Reverse sort next time
-        self.holdings_tree.heading(col, command=lambda: self._sort_column(col, not reverse))
+        self._sort_reverse[col] = not reverse
+        self._ui_dirty = True
 
     def _on_tree_double_click(self, event):
         """Handle double-click on tree item to edit."""
         self._edit_selected_ticker()
 
+    def _insert_holding(self, ticker: str, weight: float) -> str:
+        """Insert a holding row into the treeview and register it in the shadow index."""
+        weight = round(weight, 2)
+        item = self.holdings_tree.insert("", tk.END, values=(ticker, f"{weight:.2f}"))
+        self._ticker_index[ticker] = item
+        self._ticker_pos[ticker] = len(self._tickers_list)
+        self._tickers_list.append(ticker)
+        self._weights_arr = np.append(self._weights_arr, weight)
+        return item
+
+    def _insert_holdings(self, tickers: List[str], weights: np.ndarray) -> List[str]:
+        """
+        Insert many holding rows with a single Tcl evaluation and register them in the shadow index.
+
+        Parameters:
+        -----------
+        tickers : List[str]
+            Tickers to append, none of which may already be held
+        weights : np.ndarray
+            Weights (in %) aligned with tickers
+
+        Returns:
+        --------
+        List[str] : Treeview item ids of the new rows
+        """
+        if not tickers:
+            return []
+
+        weights = np.round(np.asarray(weights, dtype=np.float64), 2)
+        rows = [value for pair in zip(tickers, (f"{w:.2f}" for w in weights.tolist())) for value in pair]
+
+        tree = self.holdings_tree
+        tree.tk.setvar(_HOLDINGS_ROWS_TCL_VAR, tuple(rows))
+        items = tree.tk.splitlist(tree.tk.eval(
+            f"try {{lmap {{t w}} ${{{_HOLDINGS_ROWS_TCL_VAR}}} {{{tree} insert {{}} end -values [list $t $w]}}}} "
+            f"finally {{unset {_HOLDINGS_ROWS_TCL_VAR}}}"
+        ))
+
+        self._ticker_index.update(zip(tickers, items))
+        self._ticker_pos.update(zip(tickers, range(len(self._tickers_list), len(self._tickers_list) + len(tickers))))
+        self._tickers_list.extend(tickers)
+        self._weights_arr = np.concatenate((self._weights_arr, weights))
+        return list(items)
+
+    def _refresh_tree_weights(self):
+        """Write the shadow weight array back to the treeview rows in one pass."""
+        with self._bulk_tree_update():
+            for ticker, weight in zip(self._tickers_list, self._weights_arr.tolist()):
+                self.holdings_tree.item(self._ticker_index[ticker], values=(ticker, f"{weight:.2f}"))
+
+    @contextmanager
+    def _bulk_tree_update(self):
+        """Detach the holdings treeview from its layout while many rows change, then re-grid it once."""
+        grid_info = self.holdings_tree.grid_info()
+        self.holdings_tree.grid_forget()
+        try:
+            yield self.holdings_tree
+        finally:
+            self.holdings_tree.grid(**grid_info)
+
+    def _clear_holdings_index(self):
+        """Reset the shadow holdings index and running total."""
+        self._ticker_index.clear()
+        self._tickers_list.clear()
+        self._ticker_pos.clear()
+        self._weights_arr = np.empty(0)
+        self._weight_total = 0.0
+
     def _add_ticker_row(self, ticker: str = "", weight: float = 0.0):
         """Add a new ticker row to the holdings treeview."""
         # Open dialog to get ticker and weight
-        dialog = TickerEntryDialog(self.root, self.available_tickers, ticker, weight)
+        dialog = TickerEntryDialog(self.root, _TICKERS_TCL_VAR, ticker, weight)
 
         if dialog.result:
             ticker_value = dialog.result['ticker'].upper()
             weight_value = dialog.result['weight']
 
             # Check if ticker already exists
-            for item in self.holdings_tree.get_children():
-                if self.holdings_tree.item(item)['values'][0] == ticker_value:
-                    messagebox.showwarning("Duplicate Ticker", f"{ticker_value} is already in the portfolio.")
-                    self._log_to_console(f"Failed to add {ticker_value}: Already exists", "WARNING")
-                    return
+            if ticker_value in self._ticker_index:
+                messagebox.showwarning("Duplicate Ticker", f"{ticker_value} is already in the portfolio.")
+                self._log_to_console(f"Failed to add {ticker_value}: Already exists", "WARNING")
+                return
 
             # Add to treeview
-            self.holdings_tree.insert("", tk.END, values=(ticker_value, f"{weight_value:.2f}"))
+            self._insert_holding(ticker_value, weight_value)
+            self._weight_total += self._weights_arr[-1]
             self._update_total_weight()
             self._update_status(f"Added {ticker_value} with {weight_value:.2f}% weight")
             self._log_to_console(f"Added {ticker_value} ({weight_value:.2f}%)", "SUCCESS")
@@ -543,14 +766,14 @@ class PortfolioManagerUI:
             return
 
         item = selection[0]
-        values = self.holdings_tree.item(item)['values']
-        current_ticker = values[0]
-        current_weight = float(values[1])
+        current_ticker = self.holdings_tree.set(item, "Ticker")
+        pos = self._ticker_pos[current_ticker]
+        current_weight = float(self._weights_arr[pos])
 
         # Open dialog to edit
         dialog = TickerEntryDialog(
             self.root,
-            self.available_tickers,
+            _TICKERS_TCL_VAR,
             current_ticker,
             current_weight,
             title="Edit Ticker"
@@ -558,17 +781,28 @@ class PortfolioManagerUI:
 
         if dialog.result:
             new_ticker = dialog.result['ticker'].upper()
-            new_weight = dialog.result['weight']
+            new_weight = round(dialog.result['weight'], 2)
+            renamed = new_ticker != current_ticker
 
-            # Check if new ticker already exists (and it's not the same item)
-            for check_item in self.holdings_tree.get_children():
-                if check_item != item and self.holdings_tree.item(check_item)['values'][0] == new_ticker:
-                    messagebox.showwarning("Duplicate Ticker", f"{new_ticker} is already in the portfolio.")
-                    self._log_to_console(f"Failed to edit {current_ticker}: {new_ticker} already exists", "WARNING")
-                    return
+            # Nothing to do if the dialog was confirmed without changes
+            if not renamed and new_weight == current_weight:
+                return
+
+            # Check if new ticker already exists (only possible when renaming)
+            if renamed and new_ticker in self._ticker_index:
+                messagebox.showwarning("Duplicate Ticker", f"{new_ticker} is already in the portfolio.")
+                self._log_to_console(f"Failed to edit {current_ticker}: {new_ticker} already exists", "WARNING")
+                return
 
             # Update the item
             self.holdings_tree.item(item, values=(new_ticker, f"{new_weight:.2f}"))
+            if renamed:
+                del self._ticker_index[current_ticker], self._ticker_pos[current_ticker]
+                self._ticker_index[new_ticker] = item
+                self._ticker_pos[new_ticker] = pos
+                self._tickers_list[pos] = new_ticker
+            self._weights_arr[pos] = new_weight
+            self._weight_total += new_weight - current_weight
             self._update_total_weight()
             self._update_status(f"Updated {new_ticker}")
             self._log_to_console(f"Updated {current_ticker} → {new_ticker} ({new_weight:.2f}%)", "SUCCESS")
@@ -581,74 +815,74 @@ class PortfolioManagerUI:
             return
 
         item = selection[0]
-        ticker = self.holdings_tree.item(item)['values'][0]
+        ticker = self.holdings_tree.set(item, "Ticker")
 
         if messagebox.askyesno("Confirm", f"Remove {ticker} from portfolio?"):
             self.holdings_tree.delete(item)
+            pos = self._ticker_pos.pop(ticker)
+            del self._ticker_index[ticker], self._tickers_list[pos]
+            self._weight_total -= self._weights_arr[pos]
+            self._weights_arr = np.delete(self._weights_arr, pos)
+            # Rows after the removed one move up a position
+            for later_pos, later in enumerate(self._tickers_list[pos:], pos):
+                self._ticker_pos[later] = later_pos
             self._update_total_weight()
             self._update_status(f"Removed {ticker}")
             self._log_to_console(f"Removed {ticker}", "INFO")
 
-    def _update_total_weight(self):
-        """Update the total weight label."""
-        total = 0.0
-        for item in self.holdings_tree.get_children():
-            weight = float(self.holdings_tree.item(item)['values'][1])
-            total += weight
+    def _recompute_total_weight(self):
+        """Recompute the running total from the shadow weights and update the label."""
+        self._weight_total = float(self._weights_arr.sum())
+        self._update_total_weight()
 
-        self.total_weight_label.config(text=f"Total: {total:.2f}%")
+    def _update_total_weight(self):
+        """Update the total weight label from the running total."""
+        # Every holdings edit funnels through here
+        self._ui_dirty = True
+        total = self._weight_total
 
         # Color code the total (green if ~100%, yellow if close, red if far off)
-        if abs(total - 100.0) < 0.01:
-            self.total_weight_label.config(foreground="green")
-        elif abs(total - 100.0) < 5.0:
-            self.total_weight_label.config(foreground="orange")
-        else:
-            self.total_weight_label.config(foreground="red")
+        off = abs(total - 100.0)
+        color = "green" if off < 0.01 else "orange" if off < 5.0 else "red"
+
+        self.total_weight_label.config(text=f"Total: {total:.2f}%", foreground=color)
 
     def _equal_weight_all(self):
         """Set equal weights for all tickers."""
-        children = self.holdings_tree.get_children()
-        n = len(children)
+        n = len(self._tickers_list)
 
         if n == 0:
             messagebox.showwarning("Warning", "No tickers added yet.")
             return
 
         equal_weight = 100.0 / n
+        rounded = round(equal_weight, 2)
 
-        for item in children:
-            ticker = self.holdings_tree.item(item)['values'][0]
-            self.holdings_tree.item(item, values=(ticker, f"{equal_weight:.2f}"))
+        self._weights_arr.fill(rounded)
+        self._refresh_tree_weights()
 
+        self._weight_total = rounded * n
         self._update_total_weight()
         self._update_status(f"Set equal weights: {equal_weight:.2f}% each")
         self._log_to_console(f"Applied equal weights ({equal_weight:.2f}%) to {n} tickers", "SUCCESS")
 
     def _normalize_weights(self):
         """Normalize weights to sum to 100%."""
-        children = self.holdings_tree.get_children()
-
-        if not children:
+        if not self._tickers_list:
             messagebox.showwarning("Warning", "No tickers to normalize.")
             return
 
-        total = 0.0
-        for item in children:
-            weight = float(self.holdings_tree.item(item)['values'][1])
-            total += weight
+        total = self._weight_total
 
         if total == 0:
             messagebox.showerror("Error", "Cannot normalize: total weight is zero.")
             self._log_to_console("Failed to normalize: Total weight is zero", "ERROR")
             return
 
-        for item in children:
-            ticker = self.holdings_tree.item(item)['values'][0]
-            weight = float(self.holdings_tree.item(item)['values'][1])
-            normalized = (weight / total) * 100.0
-            self.holdings_tree.item(item, values=(ticker, f"{normalized:.2f}"))
+        self._weights_arr = np.round(self._weights_arr * (100.0 / total), 2)
+        self._refresh_tree_weights()
 
+        self._weight_total = float(self._weights_arr.sum())
         self._update_total_weight()
         self._update_status("Weights normalized to 100%")
         self._log_to_console(f"Normalized weights from {total:.2f}% to 100%", "SUCCESS")
@@ -662,23 +896,64 @@ class PortfolioManagerUI:
 
         if messagebox.askyesno("Confirm", "Remove all tickers?"):
             count = len(children)
-            for item in children:
-                self.holdings_tree.delete(item)
+            self.holdings_tree.delete(*children)
+            self._clear_holdings_index()
             self._update_total_weight()
             self._update_status("All tickers cleared")
             self._log_to_console(f"Cleared all {count} tickers", "INFO")
 
     def _get_holdings_from_ui(self) -> Dict[str, float]:
         """Extract holdings dictionary from UI treeview."""
-        holdings = {}
+        # Convert percentage to decimal
+        return dict(zip(self._tickers_list, (self._weights_arr / 100.0).tolist()))
+
+    @staticmethod
+    def _process_chunk(chunk: pd.DataFrame, ticker_col: str,
+                       weight_col: str) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Validate one chunk of an imported holdings CSV.
 
-        for item in self.holdings_tree.get_children():
-            values = self.holdings_tree.item(item)['values']
-            ticker = values[0]
-            weight = float(values[1]) / 100.0  # Convert percentage to decimal
-            holdings[ticker] = weight
+        Parameters:
+        -----------
+        chunk : pd.DataFrame
+            Rows of the CSV with the ticker and weight columns read as strings
+        ticker_col : str
+            Name of the ticker column
+        weight_col : str
+            Name of the weight column
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray, List[str]] : Valid tickers, their weights
+            (as percentages) and an error message for every rejected row
+        """
+        raw_weights = chunk[weight_col]
+        rows = chunk.index.to_numpy() + 2  # 1-based, after the header line
+
+        # Validate every row at once - skip empty tickers, flag missing/invalid/negative weights
+        tickers = chunk[ticker_col].fillna('').str.strip().str.upper().to_numpy(dtype=object)
+        weights = pd.to_numeric(raw_weights, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+        present = (tickers != '') & (tickers != 'NAN')
+        missing = present & raw_weights.isna().to_numpy()
+        invalid = present & ~missing & np.isnan(weights)
+        negative = present & (weights < 0)
+        bad = missing | invalid | negative
+        valid = present & ~bad
+
+        errors = []
+        for i in np.flatnonzero(bad):
+            if missing[i]:
+                errors.append(f"Row {rows[i]}: Missing weight for {tickers[i]}")
+            elif invalid[i]:
+                errors.append(f"Row {rows[i]}: Invalid weight '{raw_weights.iat[i]}' for {tickers[i]}")
+            else:
+                errors.append(f"Row {rows[i]}: Negative weight {weights[i]} for {tickers[i]}")
 
-        return holdings
+        # Auto-detect if weight is in decimal (0-1) or percentage (>1) format
+        weights = weights[valid]
+        weights = np.where(weights <= 1, weights * 100, weights)
+        return tickers[valid], weights, errors
 
     def _import_csv(self):
         """Import holdings from a CSV file."""
@@ -691,18 +966,15 @@ class PortfolioManagerUI:
             return
 
         try:
-            # Read CSV file
-            df = pd.read_csv(file_path)
-
-            # Check for required columns (case-insensitive)
-            df.columns = df.columns.str.strip()
-            column_map = {col.lower(): col for col in df.columns}
+            # Read only the header to locate the required columns (case-insensitive)
+            columns = pd.read_csv(file_path, nrows=0).columns
+            column_map = {col.strip().lower(): col for col in columns}
 
             if 'ticker' not in column_map or 'weight' not in column_map:
                 messagebox.showerror(
                     "Error",
                     "CSV must contain 'Ticker' and 'Weight' columns.\n\n"
-                    "Found columns: " + ", ".join(df.columns)
+                    "Found columns: " + ", ".join(columns.str.strip())
                 )
                 return
 
@@ -724,66 +996,45 @@ class PortfolioManagerUI:
                 elif choice:  # Yes - Replace
                     self._clear_all_tickers_ui_only()
 
-            # Import data
-            imported_count = 0
-            skipped_count = 0
-            errors = []
-
             self._log_to_console(f"Starting CSV import from {Path(file_path).name}", "INFO")
 
-            for idx, row in df.iterrows():
-                try:
-                    ticker = str(row[ticker_col]).strip().upper()
-                    weight_val = row[weight_col]
-
-                    # Skip empty rows
-                    if pd.isna(ticker) or ticker == '' or ticker == 'NAN':
-                        continue
-
-                    # Parse weight - handle both decimal (0.5) and percentage (50) formats
-                    if pd.isna(weight_val):
-                        errors.append(f"Row {idx + 2}: Missing weight for {ticker}")
-                        skipped_count += 1
-                        continue
-
-                    try:
-                        weight = float(weight_val)
-                    except (ValueError, TypeError):
-                        errors.append(f"Row {idx + 2}: Invalid weight '{weight_val}' for {ticker}")
-                        skipped_count += 1
-                        continue
-
-                    # Auto-detect if weight is in decimal (0-1) or percentage (>1) format
-                    if 0 <= weight <= 1:
-                        weight = weight * 100  # Convert decimal to percentage
-                    elif weight < 0:
-                        errors.append(f"Row {idx + 2}: Negative weight {weight} for {ticker}")
-                        skipped_count += 1
-                        continue
-
-                    # Check if ticker already exists
-                    ticker_exists = False
-                    for item in self.holdings_tree.get_children():
-                        if self.holdings_tree.item(item)['values'][0] == ticker:
-                            # Update existing ticker weight
-                            current_weight = float(self.holdings_tree.item(item)['values'][1])
-                            self.holdings_tree.item(item, values=(ticker, f"{weight:.2f}"))
-                            ticker_exists = True
-                            break
-
-                    if not ticker_exists:
-                        # Add new ticker
-                        self.holdings_tree.insert("", tk.END, values=(ticker, f"{weight:.2f}"))
-                        imported_count += 1
+            # Stream the two columns in chunks so large files never sit in memory at once
+            final: Dict[str, float] = {}
+            errors = []
+            imported_count = 0  # Updates of existing tickers count as imports
+            rows_read = 0
+            reader = pd.read_csv(file_path, usecols=[ticker_col, weight_col],
+                                 dtype={ticker_col: 'string', weight_col: 'string'},
+                                 chunksize=_CSV_IMPORT_CHUNK_ROWS)
+            with reader:
+                for chunk in reader:
+                    tickers, weights, chunk_errors = self._process_chunk(chunk, ticker_col, weight_col)
+                    final.update(zip(tickers.tolist(), weights.tolist()))
+                    errors.extend(chunk_errors)
+                    imported_count += len(tickers)
+                    rows_read += len(chunk)
+                    if len(chunk) == _CSV_IMPORT_CHUNK_ROWS:
+                        self._log_to_console(f"Read {rows_read:,} rows ({len(final):,} unique tickers)", "INFO")
+            skipped_count = len(errors)
+
+            new_tickers, new_weights = [], []
+            with self._bulk_tree_update():
+                for ticker, weight in final.items():
+                    pos = self._ticker_pos.get(ticker)
+                    if pos is not None:
+                        # Update existing ticker weight
+                        weight = round(weight, 2)
+                        self.holdings_tree.item(self._ticker_index[ticker], values=(ticker, f"{weight:.2f}"))
+                        self._weights_arr[pos] = weight
                     else:
-                        imported_count += 1  # Count updates as imports
+                        new_tickers.append(ticker)
+                        new_weights.append(weight)
 
-                except Exception as e:
-                    errors.append(f"Row {idx + 2}: {str(e)}")
-                    skipped_count += 1
+                # Add new tickers in one batch
+                self._insert_holdings(new_tickers, np.array(new_weights))
 
             # Update total weight display
-            self._update_total_weight()
+            self._recompute_total_weight()
 
             # Show summary
             summary = f"Import completed!\n\n"
@@ -814,7 +1065,7 @@ class PortfolioManagerUI:
 
     def _export_csv(self):
         """Export current holdings to a CSV file."""
-        if not self.holdings_tree.get_children():
+        if not self._tickers_list:
             messagebox.showwarning("Warning", "No holdings to export.")
             return
 
@@ -828,18 +1079,9 @@ class PortfolioManagerUI:
             return
 
         try:
-            # Collect data from treeview
-            data = []
-            for item in self.holdings_tree.get_children():
-                values = self.holdings_tree.item(item)['values']
-                data.append({
-                    'Ticker': values[0],
-                    'Weight': float(values[1])
-                })
-
-            # Create DataFrame and save
-            df = pd.DataFrame(data)
-            df.to_csv(file_path, index=False)
+            # Build the DataFrame from the shadow arrays (kept in treeview row order)
+            data = pd.DataFrame({'Ticker': self._tickers_list, 'Weight': self._weights_arr})
+            data.to_csv(file_path, index=False)
 
             self._update_status(f"Exported {len(data)} tickers to CSV")
             self._log_to_console(f"Exported {len(data)} tickers to {Path(file_path).name}", "SUCCESS")
@@ -850,183 +1092,226 @@ class PortfolioManagerUI:
             self._log_to_console(f"CSV export failed: {str(e)}", "ERROR")
 
     def _run_analysis(self):
-        """Run portfolio analysis with current parameters."""
-        try:
-            # Get current holdings
-            holdings = self._get_holdings_from_ui()
-            if not holdings:
-                messagebox.showerror("Error", "Please add tickers to the portfolio first.")
-                return
+        """Run portfolio analysis with current parameters on a worker thread."""
+        # Get current holdings
+        holdings = self._get_holdings_from_ui()
+        if not holdings:
+            messagebox.showerror("Error", "Please add tickers to the portfolio first.")
+            return
 
-            name = self.name_entry.get().strip() or "Portfolio"
-            portfolio = Portfolio(holdings=holdings, name=name)
-
-            # Get parameters
-            start_date = self.start_date_entry.get().strip()
-            end_date = self.end_date_entry.get().strip()
-            frequency = self.frequency_var.get()
-            use_csv = self.use_csv_var.get()
-            market_ticker = self.market_ticker_var.get()
-
-            # Show progress
-            self._update_status("Running analysis... Please wait.")
-            self.root.update()
-
-            # Calculate individual ticker metrics
-            tickers = list(holdings.keys())
-
-            # --- Analysis using selected frequency (e.g., Monthly/Weekly) ---
-            from utils import _fetch_returns, parse_date
-            start = parse_date(start_date)
-            end = parse_date(end_date)
-
-            # 1. Returns, Volatility, Sharpe, Correlation (Use selected frequency)
-            returns_df = annualized_cumulative_return(tickers, start_date, end_date, frequency, use_csv)
-            volatility_df = annualized_volatility(tickers, start_date, end_date, frequency, use_csv)
-            sharpe_df = annualized_sharpe_ratio(tickers, start_date, end_date, frequency, use_csv)
-            corr_matrix = correlation_matrix(tickers, start_date, end_date, frequency, use_csv)
-
-            # Fetch returns series for volatility calculation (using selected frequency)
-            returns_series = {}
-            for ticker in tickers:
-                returns_series[ticker] = _fetch_returns(ticker, start, end, frequency, use_csv)
-
-            # 2. Beta and Alpha values
-            beta_dict = {}
-            alpha_dict = {}
-
-            for ticker in tickers:
-                try:
-                    beta_df = beta_single_stock(ticker, start_date, end_date, frequency, use_csv, market_ticker)
-                    beta_dict[ticker] = beta_df.iloc[0, 0]
-                except Exception as e:
-                    print(f"Could not calculate beta for {ticker}: {e}")
-                    beta_dict[ticker] = None
-
-                try:
-                    alpha_df = alpha_single_stock(ticker, start_date, end_date, frequency, use_csv, market_ticker)
-                    alpha_dict[ticker] = alpha_df.iloc[0, 0]
-                except Exception as e:
-                    print(f"Could not calculate alpha for {ticker}: {e}")
-                    alpha_dict[ticker] = None
-
-            # --- Portfolio Level Calculations (using selected frequency) ---
-            portfolio_return = portfolio.portfolio_return(returns_df)['PortfolioReturn']
-            portfolio_vol = portfolio.portfolio_volatility(returns_series, corr_matrix, annualize=True)
-
-            beta_df_combined = pd.DataFrame.from_dict(beta_dict, orient='index', columns=['Beta'])
-            portfolio_beta = portfolio.portfolio_beta(beta_df_combined, 'Beta')
-
-            alpha_df_combined = pd.DataFrame.from_dict(alpha_dict, orient='index', columns=['Alpha'])
-            portfolio_alpha = portfolio.portfolio_alpha(alpha_df_combined, 'Alpha')
+        name = self.name_entry.get().strip() or "Portfolio"
+
+        # Get parameters
+        start_date = self.start_date_entry.get().strip()
+        end_date = self.end_date_entry.get().strip()
+        frequency = self.frequency_var.get()
+        use_csv = self.use_csv_var.get()
+        market_ticker = self.market_ticker_var.get()
+
+        # Reuse the previous result when nothing has changed since it was computed
+        key = (name, frozenset(holdings.items()), start_date, end_date, frequency, market_ticker, use_csv)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._log_to_console("Reusing cached analysis results for unchanged inputs", "INFO")
+            self._publish_analysis(*cached)
+            return
 
-            try:
-                risk_free_rate = annualized_sofr(start_date, end_date, frequency)
-            except:
-                risk_free_rate = 0.0
-
-            portfolio_sharpe = portfolio.portfolio_sharpe_ratio_true(portfolio_return, risk_free_rate, portfolio_vol)
-            portfolio_treynor = portfolio.portfolio_treynor_ratio(portfolio_return, risk_free_rate, portfolio_beta)
-
-            # --- NEW: Daily Series Construction (ALWAYS DAILY FOR DISTRIBUTION METRICS AND CHARTING) ---
-            daily_returns_series = {}
-            daily_freq = 'daily'
-
-            for ticker in holdings.keys():
-                daily_returns_series[ticker] = _fetch_returns(ticker, start, end, daily_freq, use_csv)
-
-            # Create a dataframe of aligned daily returns
-            aligned_daily_returns_df = pd.DataFrame(daily_returns_series).dropna()
-
-            # Calculate weighted daily return: Sum(Weight_i * Return_i)
-            portfolio_daily_ret = calculate_portfolio_daily_returns(holdings, daily_returns_series)
-
-            # Store for charting
-            self.portfolio_daily_returns = portfolio_daily_ret
-            self.benchmark_daily_returns = _fetch_returns(market_ticker, start, end, daily_freq, use_csv=True)
-
-            # --- Daily Drawdown Metrics (using portfolio_daily_ret) ---
-            cum_ret = (1 + portfolio_daily_ret).cumprod()
-            running_max = cum_ret.cummax()
-            drawdown = (cum_ret - running_max) / running_max
-
-            max_drawdown = drawdown.min()
-            pct_from_hwm = drawdown.iloc[-1]
-
-            # --- Daily Distribution Metrics (using portfolio_daily_ret) ---
-            up_days_pct = (portfolio_daily_ret > 0).mean()
-            daily_min = portfolio_daily_ret.min()
-            daily_25 = portfolio_daily_ret.quantile(0.25)
-            daily_median = portfolio_daily_ret.median()
-            daily_75 = portfolio_daily_ret.quantile(0.75)
-            daily_max = portfolio_daily_ret.max()
-            daily_std_dev = portfolio_daily_ret.std()
-            daily_skew = portfolio_daily_ret.skew()
-            daily_kurt = portfolio_daily_ret.kurt()
-
-            # Store metrics
-            self.portfolio_metrics = {
-                'portfolio_name': name,
-                'simulation_params': {
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'frequency': frequency,
-                    'market_ticker': market_ticker,
-                    'risk_free_rate': float(risk_free_rate)
-                },
-                'individual_metrics': {
-                    'returns': returns_df.to_dict()['AnnualizedReturn'],
-                    'volatility': volatility_df.to_dict()['AnnualizedVolatility'],
-                    'sharpe': sharpe_df.to_dict()['AnnualizedSharpeRatio'],
-                    'beta': beta_dict,
-                    'alpha': alpha_dict
-                },
-                'portfolio_metrics': {
-                    'portfolio_return': float(portfolio_return),
-                    'portfolio_volatility': float(portfolio_vol),
-                    'portfolio_beta': float(portfolio_beta),
-                    'portfolio_alpha': float(portfolio_alpha),
-                    'portfolio_sharpe': float(portfolio_sharpe),
-                    'portfolio_treynor': float(portfolio_treynor),
-                    # Daily Drawdown
-                    'max_drawdown': float(max_drawdown),
-                    'pct_from_hwm': float(pct_from_hwm),
-                    # Daily Stats
-                    'up_days_pct': float(up_days_pct),
-                    'daily_min': float(daily_min),
-                    'daily_25': float(daily_25),
-                    'daily_median': float(daily_median),
-                    'daily_75': float(daily_75),
-                    'daily_max': float(daily_max),
-                    'daily_std': float(daily_std_dev),
-                    'daily_skew': float(daily_skew),
-                    'daily_kurt': float(daily_kurt)
-                },
-                'correlation_matrix': corr_matrix.to_dict()
-            }
-
-            # Display results
-            self._display_results()
-
-            self._update_status("Analysis complete!")
-            messagebox.showinfo("Success", "Portfolio analysis completed successfully! You can now generate charts.")
-            self._log_to_console("Portfolio analysis completed successfully", "SUCCESS")
+        # Show progress
+        self._update_status("Running analysis... Please wait.")
+        self.run_analysis_button.config(state=tk.DISABLED)
+
+        future = self._executor.submit(self._compute_analysis, holdings, name, start_date, end_date,
+                                       frequency, use_csv, market_ticker)
+        # Tk is not thread-safe, so the main thread polls the future instead of being called back
+        self.root.after(_ANALYSIS_POLL_MS, self._poll_analysis, future, key)
+
+    def _poll_analysis(self, future: Future, key: Tuple):
+        """Check the analysis future from the Tk main thread, rescheduling until it is done."""
+        if not future.done():
+            self.root.after(_ANALYSIS_POLL_MS, self._poll_analysis, future, key)
+            return
+        self._on_analysis_done(future, key)
 
+    def _on_analysis_done(self, future: Future, key: Tuple):
+        """Handle a finished analysis future (runs on the Tk main thread)."""
+        self.run_analysis_button.config(state=tk.NORMAL)
+
+        try:
+            result = future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Analysis failed:\n{str(e)}")
             self._update_status("Analysis failed")
             self._log_to_console(f"Analysis failed: {str(e)}", "ERROR")
             import traceback
-            traceback.print_exc()
+            traceback.print_exception(type(e), e, e.__traceback__)
+            return
+
+        if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+            del self._analysis_cache[next(iter(self._analysis_cache))]
+        self._analysis_cache[key] = result
+
+        self._publish_analysis(*result)
+
+    def _publish_analysis(self, portfolio_daily_ret: pd.Series, benchmark_daily_ret: pd.Series, metrics: Dict):
+        """Store analysis results for charting and display them."""
+        # Store for charting
+        self.portfolio_daily_returns = portfolio_daily_ret
+        self.benchmark_daily_returns = benchmark_daily_ret
+        self.portfolio_metrics = metrics
+
+        # Display results
+        self._display_results()
+
+        self._update_status("Analysis complete!")
+        messagebox.showinfo("Success", "Portfolio analysis completed successfully! You can now generate charts.")
+        self._log_to_console("Portfolio analysis completed successfully", "SUCCESS")
+
+    @staticmethod
+    def _fetch_returns_concurrently(tickers: List[str], start, end, frequencies: Tuple[str, ...],
+                                    use_csv: bool) -> Tuple[Dict[str, pd.Series], ...]:
+        """
+        Fetch the returns of every ticker at each frequency on the shared utils I/O pool.
+
+        File reads and most of the CSV parser release the GIL, so the per-ticker loads overlap.
+
+        Returns:
+        --------
+        tuple : One {ticker: returns series} dict per requested frequency, in ticker order
+        """
+        # Each distinct frequency is fetched once (e.g. 'daily' requested twice shares one dict)
+        unique = tuple(dict.fromkeys(frequencies))
+        jobs = [(ticker, freq) for freq in unique for ticker in tickers]
+        results = list(utils._IO_POOL.map(
+            lambda job: utils._fetch_returns(job[0], start, end, job[1], use_csv), jobs))
+
+        n = len(tickers)
+        by_freq = {freq: dict(zip(tickers, results[i * n:(i + 1) * n])) for i, freq in enumerate(unique)}
+        return tuple(by_freq[freq] for freq in frequencies)
+
+    def _compute_analysis(self, holdings: Dict[str, float], name: str, start_date: str, end_date: str,
+                          frequency: str, use_csv: bool, market_ticker: str):
+        """
+        Compute the portfolio analysis. Runs on a worker thread and must not touch Tk widgets.
+
+        Returns:
+        --------
+        tuple : (portfolio daily returns, benchmark daily returns, metrics dict)
+        """
+        portfolio = Portfolio(holdings=holdings, name=name)
+
+        # Calculate individual ticker metrics
+        tickers = list(holdings.keys())
+
+        # --- Analysis using selected frequency (e.g., Monthly/Weekly) ---
+        from utils import _fetch_returns, parse_date
+        start = parse_date(start_date)
+        end = parse_date(end_date)
+
+        # 1. Returns, Volatility, Sharpe, Correlation (Use selected frequency)
+        returns_df = annualized_cumulative_return(tickers, start_date, end_date, frequency, use_csv)
+        volatility_df = annualized_volatility(tickers, start_date, end_date, frequency, use_csv)
+        sharpe_df = annualized_sharpe_ratio(tickers, start_date, end_date, frequency, use_csv)
+        corr_matrix = correlation_matrix(tickers, start_date, end_date, frequency, use_csv)
+
+        # Fetch returns series for volatility calculation (using selected frequency), plus the
+        # daily series used for distribution metrics and charting, reading the files concurrently
+        returns_series, daily_returns_series = self._fetch_returns_concurrently(
+            tickers, start, end, (frequency, 'daily'), use_csv)
+
+        # 2. Beta and Alpha values (each ticker's CAPM metrics are computed concurrently)
+        def capm_metric(func, label, ticker):
+            try:
+                return func(ticker, start_date, end_date, frequency, use_csv, market_ticker).iloc[0, 0]
+            except Exception as e:
+                print(f"Could not calculate {label} for {ticker}: {e}")
+                return None
+
+        # Run on the shared I/O pool so database mode reuses its threads' open connections
+        betas = utils._IO_POOL.map(lambda t: capm_metric(beta_single_stock, "beta", t), tickers)
+        alphas = utils._IO_POOL.map(lambda t: capm_metric(alpha_single_stock, "alpha", t), tickers)
+        beta_dict = dict(zip(tickers, betas))
+        alpha_dict = dict(zip(tickers, alphas))
+
+        # --- Portfolio Level Calculations (using selected frequency) ---
+        portfolio_return = portfolio.portfolio_return(returns_df)['PortfolioReturn']
+        portfolio_vol = portfolio.portfolio_volatility(returns_series, corr_matrix, annualize=True)
+
+        portfolio_beta = portfolio.portfolio_beta(pd.Series(beta_dict, dtype=np.float64, name='Beta'))
+        portfolio_alpha = portfolio.portfolio_alpha(pd.Series(alpha_dict, dtype=np.float64, name='Alpha'))
+
+        try:
+            risk_free_rate = annualized_sofr(start_date, end_date, frequency)
+        except:
+            risk_free_rate = 0.0
+
+        portfolio_sharpe = portfolio.portfolio_sharpe_ratio_true(portfolio_return, risk_free_rate, portfolio_vol)
+        portfolio_treynor = portfolio.portfolio_treynor_ratio(portfolio_return, risk_free_rate, portfolio_beta)
+
+        # --- NEW: Daily Series Construction (ALWAYS DAILY FOR DISTRIBUTION METRICS AND CHARTING) ---
+        # Calculate weighted daily return: Sum(Weight_i * Return_i), aligned and reduced with one matmul
+        portfolio_daily_ret = calculate_portfolio_daily_returns(holdings, daily_returns_series)
+
+        benchmark_daily_ret = _fetch_returns(market_ticker, start, end, 'daily', use_csv=True)
+
+        # Work on the raw returns array from here on to avoid pandas temporaries
+        daily_ret = portfolio_daily_ret.to_numpy(dtype=np.float64)
+
+        # --- Daily Drawdown and Distribution Metrics (one fused scan of portfolio_daily_ret) ---
+        max_drawdown, pct_from_hwm, up_days_pct, _, m2, m3, m4 = kernels.return_stats(daily_ret)
+
+        n = daily_ret.size
+        daily_min, daily_25, daily_median, daily_75, daily_max = np.quantile(daily_ret, [0.0, 0.25, 0.5, 0.75, 1.0])
+        daily_std_dev = np.sqrt(m2 * n / (n - 1)) if n >= 2 else np.nan
+        daily_skew, daily_kurt = _sample_skew_kurtosis(n, m2, m3, m4)
+
+        metrics = {
+            'portfolio_name': name,
+            'simulation_params': {
+                'start_date': start_date,
+                'end_date': end_date,
+                'frequency': frequency,
+                'market_ticker': market_ticker,
+                'risk_free_rate': float(risk_free_rate)
+            },
+            'individual_metrics': {
+                'returns': returns_df['AnnualizedReturn'].to_dict(),
+                'volatility': volatility_df['AnnualizedVolatility'].to_dict(),
+                'sharpe': sharpe_df['AnnualizedSharpeRatio'].to_dict(),
+                'beta': beta_dict,
+                'alpha': alpha_dict
+            },
+            'portfolio_metrics': {
+                'portfolio_return': float(portfolio_return),
+                'portfolio_volatility': float(portfolio_vol),
+                'portfolio_beta': float(portfolio_beta),
+                'portfolio_alpha': float(portfolio_alpha),
+                'portfolio_sharpe': float(portfolio_sharpe),
+                'portfolio_treynor': float(portfolio_treynor),
+                # Daily Drawdown
+                'max_drawdown': float(max_drawdown),
+                'pct_from_hwm': float(pct_from_hwm),
+                # Daily Stats
+                'up_days_pct': float(up_days_pct),
+                'daily_min': float(daily_min),
+                'daily_25': float(daily_25),
+                'daily_median': float(daily_median),
+                'daily_75': float(daily_75),
+                'daily_max': float(daily_max),
+                'daily_std': float(daily_std_dev),
+                'daily_skew': float(daily_skew),
+                'daily_kurt': float(daily_kurt)
+            },
+            # Kept as a DataFrame; callers that need plain dicts can call .to_dict() themselves
+            'correlation_matrix': corr_matrix
+        }
+
+        return portfolio_daily_ret, benchmark_daily_ret, metrics
 
     def _display_results(self):
         """Display analysis results in the text widget."""
         if not self.portfolio_metrics:
             return
 
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
-
         metrics = self.portfolio_metrics
         params = metrics['simulation_params']
         individual = metrics['individual_metrics']
@@ -1035,84 +1320,20 @@ class PortfolioManagerUI:
         # Get the frequency from params for dynamic labeling
         analysis_freq = params['frequency'].title()
 
-        # Header
-        self.results_text.insert(tk.END, "=" * 80 + "\n", "header")
-        self.results_text.insert(tk.END, f"PORTFOLIO ANALYSIS RESULTS\n", "header")
-        self.results_text.insert(tk.END, "=" * 80 + "\n\n", "header")
+        # Format the fixed part of the report once, then split it into (text, tag) pairs
+        report = _RESULTS_TEMPLATE.format_map({**params, **portfolio, 'analysis_freq': analysis_freq})
+        segments: List[str] = []
+        pos = 0
+        for span in _TAG_SPAN.finditer(report):
+            segments += (report[pos:span.start()], "", span.group(2), span.group(1))
+            pos = span.end()
+        segments += (report[pos:], "")
 
-        # Simulation parameters
-        self.results_text.insert(tk.END, "Simulation Parameters:\n", "subheader")
-        self.results_text.insert(tk.END, f"  Period: {params['start_date']} to {params['end_date']}\n")
-        self.results_text.insert(tk.END, f"  Frequency: {params['frequency']}\n")
-        self.results_text.insert(tk.END, f"  Market Benchmark: {params['market_ticker']}\n")
-        self.results_text.insert(tk.END,
-                                 f"  Risk-Free Rate: {params['risk_free_rate']:.4f} ({params['risk_free_rate'] * 100:.2f}%)\n\n")
-
-        # Portfolio-level metrics
-        self.results_text.insert(tk.END, f"Portfolio-Level Metrics (Frequency: {analysis_freq}):\n", "subheader")
-        self.results_text.insert(tk.END, f"  Annual Return:      ", "")
-        self.results_text.insert(tk.END,
-                                 f"{portfolio['portfolio_return']:.4f} ({portfolio['portfolio_return'] * 100:.2f}%)\n",
-                                 "value")
-        self.results_text.insert(tk.END, f"  Volatility (Ann.):  ", "")
-        self.results_text.insert(tk.END,
-                                 f"{portfolio['portfolio_volatility']:.4f} ({portfolio['portfolio_volatility'] * 100:.2f}%)\n",
-                                 "value")
-        self.results_text.insert(tk.END, f"  Sharpe Ratio:       ", "")
-        self.results_text.insert(tk.END, f"{portfolio['portfolio_sharpe']:.4f}\n", "value")
-        self.results_text.insert(tk.END, f"  Beta (β):           ", "")
-        self.results_text.insert(tk.END, f"{portfolio['portfolio_beta']:.4f}\n", "value")
-        self.results_text.insert(tk.END, f"  Alpha (α):          ", "")
-        self.results_text.insert(tk.END,
-                                 f"{portfolio['portfolio_alpha']:.4f} ({portfolio['portfolio_alpha'] * 100:.2f}%)\n",
-                                 "value")
-        self.results_text.insert(tk.END, f"  Treynor Ratio:      ", "")
-        self.results_text.insert(tk.END, f"{portfolio['portfolio_treynor']:.4f}\n", "value")
-
-        # Daily Drawdown Metrics
-        self.results_text.insert(tk.END, f"  Max Drawdown:       ", "")
-        self.results_text.insert(tk.END,
-                                 f"{portfolio['max_drawdown']:.4f} ({portfolio['max_drawdown'] * 100:.2f}%)\n",
-                                 "value")
-        self.results_text.insert(tk.END, f"  % From Highwater:   ", "")
-        self.results_text.insert(tk.END,
-                                 f"{portfolio['pct_from_hwm']:.4f} ({portfolio['pct_from_hwm'] * 100:.2f}%)\n\n",
-                                 "value")
-
-        # Daily Return Metrics (Explicitly Daily)
-        self.results_text.insert(tk.END, "Daily Return Statistics:\n", "subheader")
-
-        # Daily Std, Min, Max
-        self.results_text.insert(tk.END, f"  Daily Std Dev:      ", "")
-        self.results_text.insert(tk.END, f"{portfolio['daily_std'] * 100:.2f}%\n", "value")
-        self.results_text.insert(tk.END, f"  Minimum Return:     ", "")
-        self.results_text.insert(tk.END, f"{portfolio['daily_min'] * 100:.2f}%\n", "value")
-        self.results_text.insert(tk.END, f"  Maximum Return:     ", "")
-        self.results_text.insert(tk.END, f"{portfolio['daily_max'] * 100:.2f}%\n\n", "value")
-
-        # Quantiles & Up Days
-        self.results_text.insert(tk.END, f"  % of Up Days:       ", "")
-        self.results_text.insert(tk.END, f"{portfolio['up_days_pct'] * 100:.1f}%\n", "value")
-        self.results_text.insert(tk.END, f"  25th Percentile:    ", "")
-        self.results_text.insert(tk.END, f"{portfolio['daily_25'] * 100:.2f}%\n", "value")
-        self.results_text.insert(tk.END, f"  Median (50th):      ", "")
-        self.results_text.insert(tk.END, f"{portfolio['daily_median'] * 100:.2f}%\n", "value")
-        self.results_text.insert(tk.END, f"  75th Percentile:    ", "")
-        self.results_text.insert(tk.END, f"{portfolio['daily_75'] * 100:.2f}%\n\n", "value")
-
-        # Distribution Shape
-        self.results_text.insert(tk.END, f"  Skewness:           ", "")
-        self.results_text.insert(tk.END, f"{portfolio['daily_skew']:.4f}\n", "value")
-        self.results_text.insert(tk.END, f"  Kurtosis:           ", "")
-        self.results_text.insert(tk.END, f"{portfolio['daily_kurt']:.4f}\n\n", "value")
+        def add(text: str, tag: str = ""):
+            segments.append(text)
+            segments.append(tag)
 
         # Individual ticker metrics
-        self.results_text.insert(tk.END, "Individual Ticker Metrics:\n", "subheader")
-        self.results_text.insert(tk.END, "-" * 80 + "\n")
-        self.results_text.insert(tk.END,
-                                 f"{'Ticker':<8} {'Return':<12} {'Volatility':<12} {'Sharpe':<10} {'Beta':<10} {'Alpha':<10}\n")
-        self.results_text.insert(tk.END, "-" * 80 + "\n")
-
         for ticker in individual['returns'].keys():
             ret = individual['returns'][ticker]
             vol = individual['volatility'][ticker]
@@ -1120,21 +1341,22 @@ class PortfolioManagerUI:
             beta = individual['beta'].get(ticker, 'N/A')
             alpha = individual['alpha'].get(ticker, 'N/A')
 
-            self.results_text.insert(tk.END, f"{ticker:<8} ")
-            self.results_text.insert(tk.END, f"{ret:>11.2%} ", "value")
-            self.results_text.insert(tk.END, f"{vol:>11.2%} ", "value")
-            self.results_text.insert(tk.END, f"{sharpe:>9.4f} ", "value")
+            add(f"{ticker:<8} ")
+            add(f"{ret:>11.2%} {vol:>11.2%} {sharpe:>9.4f} ", "value")
 
             if isinstance(beta, (int, float)):
-                self.results_text.insert(tk.END, f"{beta:>9.4f} ", "value")
+                add(f"{beta:>9.4f} ", "value")
             else:
-                self.results_text.insert(tk.END, f"{'N/A':>9} ")
+                add(f"{'N/A':>9} ")
 
             if isinstance(alpha, (int, float)):
-                self.results_text.insert(tk.END, f"{alpha:>9.4f}\n", "value")
+                add(f"{alpha:>9.4f}\n", "value")
             else:
-                self.results_text.insert(tk.END, f"{'N/A':>9}\n")
+                add(f"{'N/A':>9}\n")
 
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, *segments)
         self.results_text.config(state=tk.DISABLED)
 
     def _generate_chart(self):
@@ -1144,11 +1366,6 @@ class PortfolioManagerUI:
             return
 
         try:
-            # Clear previous chart
-            if self.current_chart_canvas:
-                self.current_chart_canvas.get_tk_widget().destroy()
-                self.current_chart_canvas = None
-
             # Hide placeholder
             self.chart_placeholder.place_forget()
 
@@ -1185,6 +1402,12 @@ class PortfolioManagerUI:
                 messagebox.showerror("Error", f"Unknown chart type: {chart_type}")
                 return
 
+            # Hide the previous chart only when switching to a different figure; regenerating
+            # the same chart type redraws its cached figure in the canvas that is already shown
+            if self.current_chart_canvas and self.current_chart_canvas.figure is not figure:
+                self.current_chart_canvas.get_tk_widget().pack_forget()
+                self.current_chart_canvas = None
+
             # Embed the chart in the UI
             self.current_chart_canvas = self.chart_manager.embed_figure_in_tk(figure, self.chart_display_frame)
             self._update_status(f"Generated {chart_type} chart")
@@ -1237,7 +1460,7 @@ class PortfolioManagerUI:
         self.portfolio_daily_returns = None
         self.benchmark_daily_returns = None
         if self.current_chart_canvas:
-            self.current_chart_canvas.get_tk_widget().destroy()
+            self.current_chart_canvas.get_tk_widget().pack_forget()
             self.current_chart_canvas = None
         self.chart_placeholder.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
 
@@ -1246,8 +1469,8 @@ class PortfolioManagerUI:
 
     def _clear_all_tickers_ui_only(self):
         """Helper to clear ticker rows without confirmation dialog."""
-        for item in self.holdings_tree.get_children():
-            self.holdings_tree.delete(item)
+        self.holdings_tree.delete(*self.holdings_tree.get_children())
+        self._clear_holdings_index()
         self._update_total_weight()
 
     def _save_portfolio(self):
@@ -1262,13 +1485,17 @@ class PortfolioManagerUI:
             return
 
         try:
-            holdings = self._get_holdings_from_ui()
             name = self.name_entry.get().strip() or "Portfolio"
 
-            portfolio = Portfolio(holdings=holdings, name=name)
+            # Reuse the loaded/saved portfolio when neither the holdings nor the name changed
+            portfolio = self.current_portfolio
+            if self._ui_dirty or portfolio is None or portfolio.name != name:
+                portfolio = Portfolio(holdings=self._get_holdings_from_ui(), name=name)
             portfolio.to_json(self.current_file)
+            self._analysis_cache.clear()
 
             self.current_portfolio = portfolio
+            self._ui_dirty = False
             self._update_status(f"Saved to {self.current_file.name}")
             self._log_to_console(f"Saved portfolio to {self.current_file.name}", "SUCCESS")
             self._load_portfolio_list()  # Refresh list
@@ -1327,6 +1554,7 @@ class PortfolioManagerUI:
         """Internal method to load portfolio data into UI."""
         try:
             portfolio = Portfolio.from_json(file_path)
+            self._analysis_cache.clear()
 
             # Clear current UI
             self._clear_all_tickers_ui_only()
@@ -1335,14 +1563,15 @@ class PortfolioManagerUI:
             # Populate UI
             self.name_entry.insert(0, portfolio.name)
 
-            for ticker, weight in portfolio.holdings.items():
-                # Convert decimal weight back to percentage for UI
-                pct_weight = weight * 100.0
-                self.holdings_tree.insert("", tk.END, values=(ticker, f"{pct_weight:.2f}"))
+            with self._bulk_tree_update():
+                # Convert decimal weights back to percentages for UI
+                weights = np.fromiter(portfolio.holdings.values(), dtype=np.float64, count=len(portfolio.holdings))
+                self._insert_holdings(list(portfolio.holdings), weights * 100.0)
 
-            self._update_total_weight()
+            self._recompute_total_weight()
             self.current_portfolio = portfolio
             self.current_file = file_path
+            self._ui_dirty = False
             self._update_status(f"Loaded {file_path.name}")
             self._log_to_console(f"Loaded portfolio from {file_path.name}", "SUCCESS")
 
@@ -1352,15 +1581,27 @@ class PortfolioManagerUI:
 
     def _load_portfolio_list(self):
         """Refresh the list of portfolios in the left panel."""
+        try:
+            mtime = os.stat(self.portfolios_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        # Adding/removing/renaming a file bumps the directory mtime; skip the rescan otherwise
+        if mtime is not None and mtime == self._portfolios_dir_mtime:
+            return
+        self._portfolios_dir_mtime = mtime
+
         self.portfolio_listbox.delete(0, tk.END)
 
-        if not self.portfolios_dir.exists():
+        if mtime is None:
             return
 
         try:
-            files = sorted(self.portfolios_dir.glob("*.json"))
-            for file in files:
-                self.portfolio_listbox.insert(tk.END, file.name)
+            with os.scandir(self.portfolios_dir) as entries:
+                names = sorted(entry.name for entry in entries
+                               if entry.name.endswith(".json") and entry.is_file())
+            if names:
+                self.portfolio_listbox.insert(tk.END, *names)
         except Exception as e:
             print(f"Error loading portfolio list: {e}")
 
@@ -1380,10 +1621,9 @@ class PortfolioManagerUI:
             return
 
         try:
-            content = self.results_text.get(1.0, tk.END)
-
-            # Specify UTF-8 encoding to handle characters like β and α
-            with open(file_path, 'w', encoding='utf-8') as f:
+            # Encode to UTF-8 (for characters like β and α) up front and write it in one buffered call
+            content = self.results_text.get(1.0, tk.END).encode('utf-8')
+            with open(file_path, 'wb', buffering=1 << 17) as f:
                 f.write(content)
 
             self._update_status(f"Results exported to {Path(file_path).name}")
@@ -1403,27 +1643,34 @@ class PortfolioManagerUI:
         level : str
             Log level: INFO, SUCCESS, WARNING, ERROR
         """
-        from datetime import datetime
+        timestamp = _console_timestamp()
+
+        # Buffer the message; bursts of logging are written in a single flush
+        self._log_buf.append((timestamp, level, message))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(_CONSOLE_FLUSH_MS, self._flush_console)
+
+    def _flush_console(self):
+        """Write all buffered log messages to the console and trim it to the newest lines."""
+        self._log_flush_pending = False
+        if not self._log_buf:
+            return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        # Text.insert accepts alternating (chars, tags) pairs, so the whole batch is one call
+        chunks = []
+        while self._log_buf:
+            timestamp, level, message = self._log_buf.popleft()
+            indicator = _LOG_LEVEL_INDICATORS.get(level, "•")
+            chunks += (f"[{timestamp}] ", "TIMESTAMP", f"{indicator} {message}\n", level)
 
         self.console_text.config(state=tk.NORMAL)
+        self.console_text.insert(tk.END, *chunks)
 
-        # Add timestamp
-        self.console_text.insert(tk.END, f"[{timestamp}] ", "TIMESTAMP")
-
-        # Add level indicator
-        level_indicators = {
-            "INFO": "ℹ",
-            "SUCCESS": "✓",
-            "WARNING": "⚠",
-            "ERROR": "✗"
-        }
-        indicator = level_indicators.get(level, "•")
-        self.console_text.insert(tk.END, f"{indicator} ", level)
-
-        # Add message
-        self.console_text.insert(tk.END, f"{message}\n", level)
+        # The text always ends with an empty line after the last newline
+        line_count = int(self.console_text.index("end-1c").split(".")[0]) - 1
+        if line_count > _CONSOLE_MAX_LINES:
+            self.console_text.delete("1.0", f"{line_count - _CONSOLE_MAX_LINES + 1}.0")
 
         self.console_text.config(state=tk.DISABLED)
         self.console_text.see(tk.END)  # Auto-scroll to bottom
@@ -1433,11 +1680,25 @@ class PortfolioManagerUI:
         self.console_text.config(state=tk.NORMAL)
         self.console_text.delete(1.0, tk.END)
         self.console_text.config(state=tk.DISABLED)
+        self._log_buf.clear()
         self._log_to_console("Console cleared", "INFO")
 
+    def _on_close(self):
+        """Stop the analysis worker and close the main window."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def _update_status(self, message: str):
-        """Update the status bar text."""
-        self.status_bar.config(text=message)
+        """Update the status bar text (coalesced, so only the last message per idle tick is drawn)."""
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.status_bar.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Apply the most recent pending status message."""
+        self._status_scheduled = False
+        self.status_bar.config(text=self._pending_status)
 
 
 def main():
@@ -1,14 +1,29 @@
+import atexit
+import csv
+import inspect
 import sqlite3
+import numpy as np
 import pandas as pd
 import os
+import threading
 import warnings
 import matplotlib.pyplot as plt
 from math import sqrt
 from typing import List, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 from portfolio import Portfolio
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Suppress FutureWarnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
@@ -22,6 +37,16 @@ def set_data_dir(path: str):
     global DATA_DIR
     DATA_DIR = path
 
+    # Cached returns were read from the previous directory
+    clear_returns_cache()
+
+
+def clear_returns_cache():
+    """Drop all memoized returns, e.g. after the data files were replaced."""
+    _fetch_returns_cached.cache_clear()
+    _fetch_returns_wide.cache_clear()
+    annualized_sofr.cache_clear()
+
 
 def get_data_dir() -> str:
     """Get the current data directory."""
@@ -44,51 +69,73 @@ FREQ_TO_RESAMPLE = {
 
 DEFAULT_MARKET_TICKER = "SPY"
 DEFAULT_SOFR_PATH = "data/SOFR.csv"
+DB_PATH = os.path.join(os.path.dirname(__file__), "timeseries.db")
 
 
 # --- Context Managers ---
 
+# One lazily opened connection per thread, kept open for the life of the thread
+_db_local = threading.local()
+
+# Every connection opened by _get_conn, so they can all be closed at interpreter exit
+_db_conns: List[sqlite3.Connection] = []
+_db_conns_lock = threading.Lock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return this thread's database connection, opening and tuning it on first use."""
+    conn = getattr(_db_local, "conn", None)
+    if conn is None:
+        # Only this thread uses the connection; check_same_thread=False lets the exit hook close it
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # memory-map up to 256 MiB of the file
+        _db_local.conn = conn
+        with _db_conns_lock:
+            _db_conns.append(conn)
+    return conn
+
+
+# Long-lived pool for per-ticker I/O fan-out, so its threads keep (and reuse) their connections.
+# Tasks submitted here must not themselves submit to it and wait, or the pool can deadlock.
+_IO_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="utils-io")
+
+
+@atexit.register
+def _close_db_connections():
+    """Stop the I/O pool and close every per-thread database connection."""
+    _IO_POOL.shutdown(wait=True)
+    with _db_conns_lock:
+        for conn in _db_conns:
+            conn.close()
+        _db_conns.clear()
+
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections."""
-    db_path = os.path.join(os.path.dirname(__file__), "timeseries.db")
-    conn = sqlite3.connect(db_path)
-    try:
-        yield conn
-    finally:
-        conn.close()
+    """Context manager yielding the shared (per-thread) database connection; it is not closed on exit."""
+    yield _get_conn()
 
 
 # --- Decorators ---
 
 def validate_dates(func):
     """Decorator to validate date inputs."""
+    # Locate start_date/end_date in the signature once, at decoration time
+    params = list(inspect.signature(func).parameters)
+    start_idx = params.index('start_date')
+    end_idx = params.index('end_date')
 
     @wraps(func)
     def wrapper(*args, **kwargs):
         # Extract start_date and end_date from args or kwargs
-        sig_params = ['tickers', 'ticker', 'ticker1', 'ticker2', 'start_date', 'end_date']
-
-        # Find positions
-        start_idx = None
-        end_idx = None
-        for i, param in enumerate(sig_params):
-            if param == 'start_date':
-                start_idx = i
-            elif param == 'end_date':
-                end_idx = i
-
-        # Get values
-        start_date = kwargs.get('start_date')
-        end_date = kwargs.get('end_date')
+        start_date = args[start_idx] if len(args) > start_idx else kwargs.get('start_date')
+        end_date = args[end_idx] if len(args) > end_idx else kwargs.get('end_date')
 
-        if start_date is None and len(args) > 1:
-            start_date = args[1] if func.__name__ != 'correlation' else args[2]
-        if end_date is None and len(args) > 2:
-            end_date = args[2] if func.__name__ != 'correlation' else args[3]
-
-        start = parse_date(start_date)
-        end = parse_date(end_date)
+        # Dates that are already Timestamps need no parsing, only normalizing to midnight like parse_date
+        start = start_date.normalize() if isinstance(start_date, pd.Timestamp) else parse_date(start_date)
+        end = end_date.normalize() if isinstance(end_date, pd.Timestamp) else parse_date(end_date)
 
         if pd.isna(start) or pd.isna(end):
             raise ValueError("Invalid date format. Supply 'yyyy-mm-dd' or similar.")
@@ -102,8 +149,10 @@ def validate_dates(func):
 
 # --- Helper Functions ---
 
+@lru_cache(maxsize=256)
 def parse_date(date_str: str) -> pd.Timestamp:
-    """Parses a date string into a normalized pandas Timestamp."""
+    """Parses a date string into a normalized pandas Timestamp (memoized, as every
+    metric call re-parses the same analysis window)."""
     result = pd.to_datetime(date_str, errors="coerce")
     if pd.isna(result):
         return result
@@ -120,6 +169,29 @@ def _get_periods_per_year(frequency: str) -> int:
 
 # --- Database and CSV Access ---
 
+def _query_frame(conn: sqlite3.Connection, query: str, params: List, columns: List[str],
+                 text_columns: tuple = ()) -> pd.DataFrame:
+    """
+    Run a query selecting Date followed by columns and build the DataFrame straight from the
+    fetched tuples, skipping pd.read_sql's per-row type inference. Columns are float64 except
+    those named in text_columns.
+    """
+    cursor = conn.execute(query, params)
+    cursor.arraysize = 10000
+    rows = cursor.fetchall()
+
+    if not rows:
+        return pd.DataFrame({"Date": pd.to_datetime([]),
+                             **{col: np.empty(0, dtype=object if col in text_columns else np.float64)
+                                for col in columns}})
+
+    values = list(zip(*rows))
+    data = {"Date": pd.to_datetime(values[0], cache=True)}
+    for col, col_values in zip(columns, values[1:]):
+        data[col] = np.array(col_values, dtype=object if col in text_columns else np.float64)
+    return pd.DataFrame(data)
+
+
 def _fetch_from_db(conn: sqlite3.Connection, ticker: str, start: pd.Timestamp,
                    end: pd.Timestamp, columns: List[str]) -> pd.DataFrame:
     """Fetches data from the database."""
@@ -132,24 +204,57 @@ def _fetch_from_db(conn: sqlite3.Connection, ticker: str, start: pd.Timestamp,
         AND Date <= ?
         ORDER BY Date ASC
     """
-    return pd.read_sql(
-        query,
+    return _query_frame(
         conn,
-        params=[ticker.upper(), start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')],
-        parse_dates=["Date"]
+        query,
+        [ticker.upper(), start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')],
+        columns
     )
 
 
 def _fetch_from_csv(ticker: str, start: pd.Timestamp, end: pd.Timestamp,
                     columns: List[str]) -> pd.DataFrame:
-    """Fetches data from a CSV file."""
+    """
+    Fetches data from a CSV file, or from its Parquet copy (see convert_to_parquet)
+    when pyarrow is installed and the copy is up to date.
+    """
     # Use the configurable DATA_DIR instead of hardcoded path
     path = os.path.join(DATA_DIR, f"{ticker.upper()}.csv")
+    parquet_path = os.path.join(DATA_DIR, f"{ticker.upper()}.parquet")
+
+    if PYARROW_AVAILABLE and os.path.exists(parquet_path) and (
+            not os.path.exists(path) or os.path.getmtime(parquet_path) >= os.path.getmtime(path)):
+        # Read only the needed columns and let Parquet skip row groups outside the date range
+        available = set(pq.read_schema(parquet_path).names)
+        table = pq.read_table(parquet_path, columns=["Date"] + [col for col in columns if col in available],
+                              filters=[("Date", ">=", start), ("Date", "<=", end)])
+        return table.to_pandas()
 
     if not os.path.exists(path):
         raise ValueError(f"CSV for ticker {ticker} not found at {path}")
 
-    df = pd.read_csv(path, parse_dates=["Date"])
+    if PYARROW_AVAILABLE:
+        # Multithreaded Arrow parser, projecting the requested columns the file actually has
+        with open(path, newline="") as f:
+            header = next(csv.reader(f), [])
+        available = ["Date"] + [col for col in columns if col in header]
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=available,
+                column_types={"Date": pa.timestamp("ns"), **dict.fromkeys(available[1:], pa.float64())}
+            )
+        )
+        dates = table["Date"]
+        mask = pc.and_(pc.greater_equal(dates, pa.scalar(start, dates.type)),
+                       pc.less_equal(dates, pa.scalar(end, dates.type)))
+        return table.filter(mask).to_pandas()
+
+    # Parse only the requested columns, with fixed float dtypes
+    wanted = {"Date", *columns}
+    df = pd.read_csv(path, usecols=lambda col: col in wanted, parse_dates=["Date"],
+                     dtype=dict.fromkeys(columns, "float64"), engine="c", memory_map=True)
     df = df[(df["Date"] >= start) & (df["Date"] <= end)]
 
     # Select requested columns plus Date
@@ -157,6 +262,53 @@ def _fetch_from_csv(ticker: str, start: pd.Timestamp, end: pd.Timestamp,
     return df[available_cols].copy()
 
 
+def convert_to_parquet(tickers: Optional[List[str]] = None) -> List[str]:
+    """
+    Write a Parquet copy of each ticker CSV in DATA_DIR, which _fetch_from_csv then
+    reads in place of the CSV. Requires pyarrow.
+
+    Parameters:
+    -----------
+    tickers : List[str], optional
+        Tickers to convert. If None, converts every CSV in DATA_DIR.
+
+    Returns:
+    --------
+    List[str] : Paths of the Parquet files written
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("convert_to_parquet requires pyarrow (pip install pyarrow).")
+
+    if tickers is None:
+        tickers = [name[:-4] for name in os.listdir(DATA_DIR) if name.endswith(".csv")]
+
+    written = []
+    for ticker in tickers:
+        path = os.path.join(DATA_DIR, f"{ticker.upper()}.csv")
+        table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(
+            column_types={"Date": pa.timestamp("ns")}))
+        parquet_path = os.path.join(DATA_DIR, f"{ticker.upper()}.parquet")
+        pq.write_table(table, parquet_path)
+        written.append(parquet_path)
+    return written
+
+
+def create_db_index():
+    """
+    Create the covering (Ticker, Date, Close, return_1d) index on the timeseries table
+    of DB_PATH, turning ticker/date range queries into an index seek with no row lookups
+    or sort. Run once after building or rebuilding the database; it is a no-op if the
+    index already exists.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        with conn:
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tick_date "
+                         "ON timeseries(Ticker, Date, Close, return_1d)")
+    finally:
+        conn.close()
+
+
 def get_prices_db(conn: sqlite3.Connection, ticker: str, start: pd.Timestamp,
                   end: pd.Timestamp) -> pd.DataFrame:
     """Fetches stock prices from the database."""
@@ -181,6 +333,23 @@ def get_returns_csv(ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.D
 
 # --- Data Processing ---
 
+def _period_end_dates(dates: np.ndarray, rule: str) -> np.ndarray:
+    """Map datetime64 dates to the end date of their week (ending Sunday, "W") or month ("ME")."""
+    days = dates.astype("datetime64[D]")
+    if rule == "W":
+        # 1970-01-01 was a Thursday, so (days + 3) % 7 is the weekday with Monday = 0
+        return days + (6 - (days.astype(np.int64) + 3) % 7)
+    return (days.astype("datetime64[M]") + 1).astype("datetime64[D]") - 1
+
+
+def _period_end_range(first: np.datetime64, last: np.datetime64, rule: str) -> np.ndarray:
+    """Every period-end date (see _period_end_dates) from first through last."""
+    if rule == "W":
+        return np.arange(first, last + 1, 7)
+    months = np.arange(first.astype("datetime64[M]"), last.astype("datetime64[M]") + 1)
+    return (months + 1).astype("datetime64[D]") - 1
+
+
 def resample_frequency(df: pd.DataFrame, freq: str, column: str = "return_1d") -> pd.DataFrame:
     """Resamples a DataFrame to a specified frequency."""
     if freq.lower() in ["daily", "1d"]:
@@ -190,12 +359,18 @@ def resample_frequency(df: pd.DataFrame, freq: str, column: str = "return_1d") -
     if rule is None:
         raise ValueError(f"Frequency must be one of {list(FREQ_TO_RESAMPLE.keys()) + ['daily', '1d']}")
 
-    df = df.set_index("Date").sort_index()
-
-    # Handle returns: compound them
+    # Handle returns: compound them within each period, grouping on the period-end date directly
     if column == "return_1d" and column in df.columns:
-        resampled = (1 + df["return_1d"]).resample(rule).prod() - 1
-        return resampled.to_frame(name="return_1d").dropna().reset_index()
+        dates = df["Date"].to_numpy()
+        labels = _period_end_dates(dates, rule)
+        compounded = pd.Series(1 + df["return_1d"].to_numpy()).groupby(labels).prod() - 1
+
+        # Periods without any rows compound to 0, as with resample()
+        compounded = compounded.reindex(_period_end_range(labels.min(), labels.max(), rule), fill_value=0.0)
+        return pd.DataFrame({"Date": compounded.index.to_numpy().astype(dates.dtype),
+                             "return_1d": compounded.to_numpy()})
+
+    df = df.set_index("Date").sort_index()
 
     # Handle prices: take the last price in each period
     if "Close" in df.columns:
@@ -209,12 +384,41 @@ def resample_frequency(df: pd.DataFrame, freq: str, column: str = "return_1d") -
         return df.reset_index()
 
 
+def _source_mtime(ticker: str, use_csv: bool) -> int:
+    """
+    Modification time (ns) of the file a ticker's returns are read from (0 if it is missing),
+    so memoized returns are re-read after the data file changes.
+    """
+    if use_csv:
+        paths = [os.path.join(DATA_DIR, f"{ticker}.csv"), os.path.join(DATA_DIR, f"{ticker}.parquet")]
+    else:
+        paths = [DB_PATH]
+    mtime = 0
+    for path in paths:
+        try:
+            mtime = max(mtime, os.stat(path).st_mtime_ns)
+        except OSError:
+            pass
+    return mtime
+
+
 def _fetch_returns(ticker: str, start: pd.Timestamp, end: pd.Timestamp,
                    frequency: str, use_csv: bool) -> pd.Series:
     """
     Internal helper to fetch, check, and resample returns for a single ticker.
-    Returns a clean pandas Series of returns.
+    Returns a clean pandas Series of returns. Results are memoized and shared
+    between callers, so callers must not modify the returned Series in place.
     """
+    # Normalize the arguments so equivalent calls share one cache entry
+    ticker = ticker.upper()
+    use_csv = bool(use_csv)
+    return _fetch_returns_cached(ticker, start, end, frequency.lower(), use_csv, _source_mtime(ticker, use_csv))
+
+
+@lru_cache(maxsize=512)
+def _fetch_returns_cached(ticker: str, start: pd.Timestamp, end: pd.Timestamp,
+                          frequency: str, use_csv: bool, mtime: int) -> pd.Series:
+    """Memoized body of _fetch_returns, keyed on normalized arguments and the source file's mtime."""
     # Fetch data
     if use_csv:
         df = get_returns_csv(ticker, start, end)
@@ -244,11 +448,135 @@ def _fetch_returns(ticker: str, start: pd.Timestamp, end: pd.Timestamp,
     return returns
 
 
+def _fetch_returns_batch(tickers: List[str], start: pd.Timestamp, end: pd.Timestamp,
+                         frequency: str, use_csv: bool) -> pd.DataFrame:
+    """
+    Internal helper to fetch and resample returns for several tickers at once.
+    Returns a wide DataFrame indexed by Date with one column per (upper-cased) ticker;
+    each column holds the same values _fetch_returns gives for that ticker, padded with NaN.
+    Like _fetch_returns, the result is memoized and must not be modified in place.
+    """
+    symbols = tuple(dict.fromkeys(ticker.upper() for ticker in tickers))
+    use_csv = bool(use_csv)
+    mtimes = tuple(_source_mtime(ticker, True) for ticker in symbols) if use_csv else _source_mtime("", False)
+    return _fetch_returns_wide(symbols, start, end, frequency.lower(), use_csv, mtimes)
+
+
+@lru_cache(maxsize=64)
+def _fetch_returns_wide(symbols: tuple, start: pd.Timestamp, end: pd.Timestamp,
+                        frequency: str, use_csv: bool, mtimes) -> pd.DataFrame:
+    """
+    Memoized body of _fetch_returns_batch, keyed on the de-duplicated upper-cased tickers
+    and the source files' mtimes.
+    """
+    # Fetch data - one query for every ticker from the database (unordered; the pivot sorts by
+    # date), one file per ticker from CSV
+    if use_csv:
+        # Files are independent, so read them on the shared I/O pool (parsing releases the GIL)
+        frames = _IO_POOL.map(lambda ticker: get_returns_csv(ticker, start, end), symbols)
+        wide = pd.DataFrame({ticker: df.set_index("Date")["return_1d"]
+                             for ticker, df in zip(symbols, frames)})
+    else:
+        placeholders = ", ".join("?" * len(symbols))
+        query = f"""
+            SELECT Date, Ticker, return_1d
+            FROM timeseries
+            WHERE Ticker IN ({placeholders})
+            AND Date >= ?
+            AND Date <= ?
+        """
+        with get_db_connection() as conn:
+            long_df = _query_frame(
+                conn,
+                query,
+                [*symbols, start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')],
+                ["Ticker", "return_1d"],
+                text_columns=("Ticker",)
+            )
+        wide = long_df.pivot(index="Date", columns="Ticker", values="return_1d").reindex(columns=list(symbols))
+    wide = wide.sort_index()
+    wide.columns.name = None
+
+    # Resample the whole frame at once if needed
+    if frequency.lower() not in ["daily", "1d"]:
+        rule = FREQ_TO_RESAMPLE.get(frequency.lower())
+        if rule is None:
+            raise ValueError(f"Frequency must be one of {list(FREQ_TO_RESAMPLE.keys()) + ['daily', '1d']}")
+
+        # Compound within each period, keeping only periods inside each ticker's own data range
+        has_data = wide.notna().resample(rule).sum() > 0
+        in_range = has_data.cummax() & has_data[::-1].cummax()[::-1]
+        wide = ((1 + wide).resample(rule).prod() - 1).where(in_range)
+
+    counts = wide.count()
+    if (counts == 0).any():
+        raise ValueError(f"No data found for ticker {counts.index[counts.to_numpy() == 0][0]} in date range.")
+
+    # Check for constant returns
+    for ticker in wide.columns[(wide.std() == 0) & (wide.mean() == 0) & (counts > 1)]:
+        warnings.warn(f"Returns for {ticker} are all zero; volatility is 0.")
+
+    return wide
+
+
+def _annualize(returns: Union[pd.Series, pd.DataFrame], frequency: str):
+    """
+    Internal helper to compute the annualized cumulative return and annualized volatility
+    of a returns Series (as floats) or of every column of a wide returns DataFrame (as Series).
+    """
+    periods_per_year = _get_periods_per_year(frequency)
+    cumulative = (1 + returns).prod() - 1
+    years = returns.count() / periods_per_year
+    annualized_return = (1 + cumulative) ** (1 / years) - 1
+    annualized_vol = returns.std() * sqrt(periods_per_year)
+    return annualized_return, annualized_vol
+
+
+def _compute_return_and_vol(tickers: List[str], start: pd.Timestamp, end: pd.Timestamp,
+                            frequency: str, use_csv: bool):
+    """
+    Internal helper returning (annualized return, annualized volatility) Series indexed by
+    ticker, both computed from a single fetch of the returns.
+    """
+    return _annualize(_fetch_returns_batch(tickers, start, end, frequency, use_csv), frequency)
+
+
+def _beta_from_returns(returns_asset: pd.Series, returns_market: pd.Series,
+                       ticker: str, market_ticker: str) -> float:
+    """Internal helper computing Beta from already-fetched asset and market returns."""
+    # Combine and Synchronize DataFrames
+    df_asset = returns_asset.to_frame(name="R_asset")
+    df_market = returns_market.to_frame(name="R_market")
+    combined = pd.merge(df_asset, df_market, left_index=True, right_index=True, how='inner')
+
+    if combined.empty:
+        raise ValueError(f"No overlapping data for {ticker.upper()} and {market_ticker.upper()} in date range.")
+
+    if len(combined) < 2:
+        raise ValueError("Not enough data points for covariance/variance calculation.")
+
+    # Calculate Beta from the 2x2 sample covariance matrix (the merged rows are aligned and NaN-free)
+    cov = np.cov(combined.to_numpy(), rowvar=False)
+    market_variance = cov[1, 1]
+
+    if market_variance == 0:
+        warnings.warn(f"Market variance is zero for {market_ticker}. Beta is set to 0.")
+        return 0.0
+    return float(cov[0, 1] / market_variance)
+
+
+@lru_cache(maxsize=4)
 def _load_sofr_data(csv_path: str) -> pd.DataFrame:
-    """Load and clean SOFR data from CSV."""
-    df = pd.read_csv(csv_path)
-    df["Date"] = pd.to_datetime(df["Date"], format='%m/%d/%Y', errors='coerce').dt.normalize()
-    df["Rate"] = pd.to_numeric(df["Rate (%)"].astype(str).str.replace('%', ''), errors="coerce") / 100.0
+    """Load and clean SOFR data from CSV (memoized; callers must not modify the result in place)."""
+    df = pd.read_csv(csv_path, usecols=["Date", "Rate (%)"])
+    df["Date"] = pd.to_datetime(df["Date"], format='%m/%d/%Y', errors='coerce', cache=True).dt.normalize()
+
+    # Only strip '%' signs when the column was read as text
+    rates = df["Rate (%)"]
+    if rates.dtype.kind in "fiu":
+        df["Rate"] = rates.astype("float64") / 100.0
+    else:
+        df["Rate"] = pd.to_numeric(rates.str.rstrip('%'), errors="coerce") / 100.0
     return df[["Date", "Rate"]].dropna(subset=["Rate", "Date"])
 
 
@@ -266,26 +594,8 @@ def annualized_cumulative_return(tickers: Union[str, List[str]], start_date: str
     start = parse_date(start_date)
     end = parse_date(end_date)
 
-    returns_dict = {}
-
-    for ticker in tickers:
-        returns = _fetch_returns(ticker, start, end, frequency, use_csv)
-
-        # Compute cumulative return over period
-        cumulative = (1 + returns).prod() - 1
-
-        # Annualize the cumulative return
-        n_periods = len(returns)
-        periods_per_year = _get_periods_per_year(frequency)
-        years = n_periods / periods_per_year
-
-        if years == 0:
-            raise ValueError(f"Years elapsed is zero for ticker {ticker}.")
-
-        annualized = (1 + cumulative) ** (1 / years) - 1
-        returns_dict[ticker.upper()] = annualized
-
-    return pd.DataFrame.from_dict(returns_dict, orient="index", columns=["AnnualizedReturn"])
+    annualized, _ = _compute_return_and_vol(tickers, start, end, frequency, use_csv)
+    return annualized.to_frame(name="AnnualizedReturn")
 
 
 @validate_dates
@@ -298,21 +608,17 @@ def annualized_volatility(tickers: Union[str, List[str]], start_date: str, end_d
     start = parse_date(start_date)
     end = parse_date(end_date)
 
-    vol_dict = {}
-
-    for ticker in tickers:
-        returns = _fetch_returns(ticker, start, end, frequency, use_csv)
-        stdev = returns.std()
-        periods_per_year = _get_periods_per_year(frequency)
-        annualized = stdev * sqrt(periods_per_year)
-        vol_dict[ticker.upper()] = annualized
-
-    return pd.DataFrame.from_dict(vol_dict, orient="index", columns=["AnnualizedVolatility"])
+    _, annualized = _compute_return_and_vol(tickers, start, end, frequency, use_csv)
+    return annualized.to_frame(name="AnnualizedVolatility")
 
 
+@lru_cache(maxsize=64)
 def annualized_sofr(start_date: str, end_date: str, frequency: str = "daily",
                     csv_path: str = DEFAULT_SOFR_PATH) -> float:
-    """Calculate the annualized realized SOFR rate over a specified date range and frequency."""
+    """
+    Calculate the annualized realized SOFR rate over a specified date range and frequency.
+    Results are memoized per (start_date, end_date, frequency, csv_path).
+    """
     df = _load_sofr_data(csv_path)
 
     if df.empty:
@@ -362,25 +668,21 @@ def annualized_sharpe_ratio(tickers: Union[str, List[str]], start_date: str, end
         warnings.warn(f"Could not fetch SOFR: {e}. Using R_f = 0 for Sharpe Ratio calculation.")
         r_f = 0.0
 
-    # Get Annualized Return and Volatility
-    annual_returns_df = annualized_cumulative_return(tickers, start_date, end_date, frequency, use_csv)
-    annual_vol_df = annualized_volatility(tickers, start_date, end_date, frequency, use_csv)
-
-    sharpe_dict = {}
-    for ticker in tickers:
-        ticker_upper = ticker.upper()
-        r_asset = annual_returns_df.loc[ticker_upper, "AnnualizedReturn"]
-        vol_asset = annual_vol_df.loc[ticker_upper, "AnnualizedVolatility"]
+    # Get Annualized Return and Volatility from one fetch of the returns
+    start = parse_date(start_date)
+    end = parse_date(end_date)
+    r_asset, vol_asset = _compute_return_and_vol(tickers, start, end, frequency, use_csv)
 
-        if vol_asset == 0:
-            sharpe = float('inf') if (r_asset - r_f) > 0 else 0.0
-            warnings.warn(f"Volatility is zero for {ticker_upper}. Sharpe is set to {sharpe}.")
-        else:
-            sharpe = (r_asset - r_f) / vol_asset
+    excess = (r_asset - r_f).to_numpy()
+    vol = vol_asset.to_numpy()
+    zero_vol = vol == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(zero_vol, np.where(excess > 0, np.inf, 0.0), excess / vol)
 
-        sharpe_dict[ticker_upper] = sharpe
+    for ticker, value in zip(vol_asset.index[zero_vol], sharpe[zero_vol]):
+        warnings.warn(f"Volatility is zero for {ticker}. Sharpe is set to {value}.")
 
-    return pd.DataFrame.from_dict(sharpe_dict, orient="index", columns=["AnnualizedSharpeRatio"])
+    return pd.DataFrame({"AnnualizedSharpeRatio": sharpe}, index=vol_asset.index)
 
 
 @validate_dates
@@ -397,26 +699,7 @@ def beta_single_stock(ticker: str, start_date: str, end_date: str, frequency: st
     returns_asset = _fetch_returns(ticker, start, end, frequency, use_csv)
     returns_market = _fetch_returns(market_ticker, start, end, frequency, use_csv=True)
 
-    # Combine and Synchronize DataFrames
-    df_asset = returns_asset.to_frame(name="R_asset")
-    df_market = returns_market.to_frame(name="R_market")
-    combined = pd.merge(df_asset, df_market, left_index=True, right_index=True, how='inner')
-
-    if combined.empty:
-        raise ValueError(f"No overlapping data for {ticker.upper()} and {market_ticker.upper()} in date range.")
-
-    if len(combined) < 2:
-        raise ValueError("Not enough data points for covariance/variance calculation.")
-
-    # Calculate Beta
-    covariance = combined["R_asset"].cov(combined["R_market"])
-    market_variance = combined["R_market"].var()
-
-    if market_variance == 0:
-        warnings.warn(f"Market variance is zero for {market_ticker}. Beta is set to 0.")
-        beta = 0.0
-    else:
-        beta = covariance / market_variance
+    beta = _beta_from_returns(returns_asset, returns_market, ticker, market_ticker)
 
     return pd.DataFrame.from_dict({ticker.upper(): beta}, orient="index",
                                   columns=[f"Beta_vs_{market_ticker.upper()}"])
@@ -436,15 +719,15 @@ def alpha_single_stock(ticker: str, start_date: str, end_date: str, frequency: s
         warnings.warn(f"Could not fetch SOFR: {e}. Using R_f = 0 for Alpha calculation.")
         r_f = 0.0
 
-    # Get Beta, Asset Return, and Market Return
-    beta_df = beta_single_stock(ticker, start_date, end_date, frequency, use_csv, market_ticker)
-    beta = beta_df.iloc[0, 0]
-
-    r_asset_df = annualized_cumulative_return(ticker, start_date, end_date, frequency, use_csv)
-    r_asset = r_asset_df.iloc[0, 0]
+    # Get Beta, Asset Return, and Market Return from one fetch of each series
+    start = parse_date(start_date)
+    end = parse_date(end_date)
+    returns_asset = _fetch_returns(ticker, start, end, frequency, use_csv)
+    returns_market = _fetch_returns(market_ticker, start, end, frequency, use_csv=True)
 
-    r_market_df = annualized_cumulative_return(market_ticker, start_date, end_date, frequency, use_csv=True)
-    r_market = r_market_df.iloc[0, 0]
+    beta = _beta_from_returns(returns_asset, returns_market, ticker, market_ticker)
+    r_asset, _ = _annualize(returns_asset, frequency)
+    r_market, _ = _annualize(returns_market, frequency)
 
     # Calculate Alpha
     required_return = r_f + beta * (r_market - r_f)
@@ -491,15 +774,12 @@ def correlation_matrix(tickers: List[str], start_date: str, end_date: str,
     start = parse_date(start_date)
     end = parse_date(end_date)
 
-    all_returns = []
-    for ticker in tickers:
-        df_returns = _fetch_returns(ticker, start, end, frequency, use_csv)
-        df_returns = df_returns.to_frame(name=ticker.upper())
-        all_returns.append(df_returns)
-
-    combined = pd.concat(all_returns, axis=1, join='inner')
+    # Keep only the dates every ticker has data for
+    combined = _fetch_returns_batch(tickers, start, end, frequency, use_csv).dropna()
 
     if combined.empty:
         raise ValueError("No overlapping data found for the specified tickers in date range.")
 
-    return combined.corr()
\ No newline at end of file
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.atleast_2d(np.corrcoef(combined.to_numpy(), rowvar=False))
+    return pd.DataFrame(corr, index=combined.columns, columns=combined.columns)
\ No newline at end of file